@@ -2,17 +2,22 @@
 """Parse benchmark results from JSON and display summary."""
 
 import json
+import sys
 
 with open("benchmark.json") as f:
     data = json.load(f)
 
-print("| Test | Min | Mean | Max | Stddev |")
-print("|------|-----|------|-----|--------|")
-for bench in data["benchmarks"]:
-    print(
-        f"| {bench['name']} | "
-        f"{bench['stats']['min']:.3f}s | "
-        f"{bench['stats']['mean']:.3f}s | "
-        f"{bench['stats']['max']:.3f}s | "
-        f"{bench['stats']['stddev']:.3f}s |"
-    )
+# Build the whole table and emit it with a single write
+rows = [
+    "| Test | Min | Mean | Max | Stddev |",
+    "|------|-----|------|-----|--------|",
+]
+rows.extend(
+    f"| {bench['name']} | "
+    f"{bench['stats']['min']:.3f}s | "
+    f"{bench['stats']['mean']:.3f}s | "
+    f"{bench['stats']['max']:.3f}s | "
+    f"{bench['stats']['stddev']:.3f}s |"
+    for bench in data["benchmarks"]
+)
+sys.stdout.write("\n".join(rows) + "\n")
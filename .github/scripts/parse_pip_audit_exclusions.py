@@ -5,15 +5,18 @@ import sys
 
 import yaml  # type: ignore[import-untyped]
 
+# Prefer the libyaml-backed loader; fall back to pure Python if it is unavailable
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 try:
     with open(".pip-audit-exclusions.yaml") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
     vulns = []
     if isinstance(data, dict):
         for package, vuln_list in data.items():
             if isinstance(vuln_list, list) and package not in ["#", "comment"]:
                 vulns.extend(vuln_list)
-    print(" ".join(vulns))
+    sys.stdout.write(" ".join(vulns) + "\n")
 except Exception as e:
     print(f"ERROR: {e}", file=sys.stderr)
     sys.exit(1)
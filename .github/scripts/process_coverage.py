@@ -14,23 +14,35 @@ try:
     # Generate summary with emojis based on coverage
     emoji = "🟢" if coverage_pct >= 85 else "🟡" if coverage_pct >= 70 else "🔴"
 
-    summary = f"""### 📊 Coverage Report
-
-{emoji} **Total Coverage: {coverage_pct:.1f}%**
-
-| Metric | Value |
-|--------|-------|
-| Lines Covered | {totals["covered_lines"]:,} / {totals["num_statements"]:,} |
-| Branches | {totals.get("covered_branches", 0):,} / {totals.get("num_branches", 0):,} |
-| Missing Lines | {totals["missing_lines"]:,} |
-| Excluded Lines | {totals.get("excluded_lines", 0):,} |
-"""
+    pct_text = f"{coverage_pct:.1f}%"
+    covered_lines = f"{totals['covered_lines']:,}"
+    num_statements = f"{totals['num_statements']:,}"
+    covered_branches = f"{totals.get('covered_branches', 0):,}"
+    num_branches = f"{totals.get('num_branches', 0):,}"
+    missing_lines = f"{totals['missing_lines']:,}"
+    excluded_lines = f"{totals.get('excluded_lines', 0):,}"
+
+    summary = "\n".join(
+        [
+            "### 📊 Coverage Report",
+            "",
+            f"{emoji} **Total Coverage: {pct_text}**",
+            "",
+            "| Metric | Value |",
+            "|--------|-------|",
+            f"| Lines Covered | {covered_lines} / {num_statements} |",
+            f"| Branches | {covered_branches} / {num_branches} |",
+            f"| Missing Lines | {missing_lines} |",
+            f"| Excluded Lines | {excluded_lines} |",
+            "",
+        ]
+    )
 
     # Write to GitHub summary if available
     if "GITHUB_STEP_SUMMARY" in os.environ:
         with open(os.environ["GITHUB_STEP_SUMMARY"], "a") as f:
             f.write(summary)
 
-    print(f"Coverage: {coverage_pct:.1f}%")
+    print(f"Coverage: {pct_text}")
 except Exception as e:
     print(f"Error processing coverage: {e}")
@@ -5,7 +5,7 @@ across three main levels: Commit → LogicalChange → Release.
 """
 
 # Core data models
-from .commit import Commit
+from .commit import Commit, dump_commits
 from .shared import (
     ChangeMetadata,
     Diff,
@@ -26,4 +26,5 @@ __all__ = [
     "GitActor",
     "GitMetadata",
     "GitSHA",
+    "dump_commits",
 ]
@@ -1,6 +1,9 @@
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 from .shared import Diff, GitMetadata
+from .utils import REF_NAME_PATTERN
 
 
 class Commit(BaseModel):
@@ -44,10 +47,11 @@ class Commit(BaseModel):
         - Character encoding validation
         - Format-specific validation (e.g., conventional commits)
         """
-        if not v.strip():
+        # Whitespace has already been stripped by str_strip_whitespace
+        if not v:
             msg = "Summary and message cannot be empty or whitespace-only"
             raise ValueError(msg)
-        return v.strip()
+        return v
 
     @field_validator("branches", "tags")
     @classmethod
@@ -55,21 +59,21 @@ class Commit(BaseModel):
         """Validate branch and tag name lists.
 
         TODO: Add comprehensive Git name validation:
-        - Git ref name rules (no spaces, special characters, etc.)
+        - Git ref name rules (special characters, '..', '@{', etc.)
         - Length limits
         - Reserved name checks
         """
-        # Basic validation - ensure no empty strings
-        validated = []
-        for name in v:
-            if not isinstance(name, str):
-                raise ValueError("Branch and tag names must be strings")
-            stripped = name.strip()
-            if not stripped:
-                msg = "Branch and tag names cannot be empty or whitespace-only"
-                raise ValueError(msg)
-            validated.append(stripped)
-        return validated
+        # Basic validation - ensure no empty names or embedded whitespace.
+        # Items are already typed as str and stripped by str_strip_whitespace,
+        # so clean input is returned as-is without building any new list.
+        if not all(map(REF_NAME_PATTERN.fullmatch, v)):
+            invalid = [name for name in v if not REF_NAME_PATTERN.fullmatch(name)]
+            msg = (
+                "Branch and tag names cannot be empty or contain whitespace, "
+                f"got {invalid!r}"
+            )
+            raise ValueError(msg)
+        return v
 
     @field_validator("ai_summary")
     @classmethod
@@ -87,12 +91,27 @@ class Commit(BaseModel):
             return None
         return v.strip()
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "Commit":
+        """Create a Commit from already-validated data without re-validation.
+
+        Intended for hot paths that replay previously validated commits (e.g.
+        from a cache). Nested ``metadata`` and ``diff`` values must already be
+        model instances. Use the regular constructor for external input.
+        """
+        return cls.model_construct(**data)
+
     def has_ai_summary(self) -> bool:
         """Check if this commit has an AI-generated summary."""
-        return self.ai_summary is not None and len(self.ai_summary.strip()) > 0
+        # ai_summary can be assigned after construction without validation, so
+        # blank values are still possible; isspace() checks without a copy
+        ai_summary = self.ai_summary
+        return ai_summary is not None and ai_summary != "" and not ai_summary.isspace()
 
     def get_short_sha(self, length: int = 8) -> str:
         """Get abbreviated SHA for display purposes."""
+        if length == 8:
+            return self.metadata.short_sha
         return self.metadata.sha[:length]
 
     def is_merge_commit(self) -> bool:
@@ -113,11 +132,9 @@ class Commit(BaseModel):
 
     def __str__(self) -> str:
         """Returns the commit in a compact format suitable for logs."""
-        short_sha = self.get_short_sha()
-        if len(self.summary) > 50:
-            summary_preview = self.summary[:50] + "..."
-        else:
-            summary_preview = self.summary
+        # Read each attribute once into locals; this is called per commit in logs
+        summary = self.summary
+        summary_preview = summary if len(summary) <= 50 else summary[:50] + "..."
 
         # Include basic change info
         files_changed = self.diff.files_changed_count
@@ -126,18 +143,37 @@ class Commit(BaseModel):
         ai_indicator = " [AI]" if self.has_ai_summary() else ""
 
         return (
-            f"{short_sha} {summary_preview} "
+            f"{self.metadata.short_sha} {summary_preview} "
             f"({files_changed} {files_word}){ai_indicator}"
         )
 
     def __repr__(self) -> str:
         """Detailed representation for debugging."""
+        metadata = self.metadata
         return (
-            f"Commit(sha='{self.get_short_sha()}', "
-            f"author='{self.metadata.author.name}', "
+            f"Commit(sha='{metadata.short_sha}', "
+            f"author='{metadata.author.name}', "
             f"summary='{self.summary[:30]}...', "
             f"branches={len(self.branches)}, "
             f"tags={len(self.tags)}, "
             f"files_changed={self.diff.files_changed_count}, "
             f"ai_summary={'Yes' if self.has_ai_summary() else 'No'})"
         )
+
+
+_COMMIT_LIST_ADAPTER = TypeAdapter(list[Commit])
+
+
+def dump_commits(commits: list[Commit]) -> bytes:
+    """Serialize commits to a JSON array in a single pass.
+
+    Uses Pydantic's compiled serializer for the whole list, avoiding a
+    per-commit ``model_dump()`` dict followed by a separate ``json.dumps``.
+
+    Args:
+        commits: Commits to serialize
+
+    Returns:
+        UTF-8 encoded JSON array in ``Commit.model_dump_json()`` layout
+    """
+    return _COMMIT_LIST_ADAPTER.dump_json(commits)
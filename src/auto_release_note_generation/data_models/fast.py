@@ -0,0 +1,143 @@
+"""msgspec mirrors of the commit models for bulk ingest of trusted data.
+
+The Pydantic models remain the public API and the validation boundary for
+external input. These Structs decode large JSON payloads of commits that
+have already been validated once (for example, ``Commit.model_dump_json()``
+output replayed from a cache) and convert them through the ``from_trusted``
+constructors without re-running field validators.
+
+Requires the optional ``fast`` extra (``msgspec``).
+"""
+
+import sys
+from datetime import datetime
+
+import msgspec
+
+from .commit import Commit
+from .shared import Diff, FileModification, GitActor, GitMetadata
+
+
+class GitActorStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Mirror of GitActor."""
+
+    name: str
+    email: str
+    timestamp: datetime
+
+    def to_pydantic(self) -> GitActor:
+        """Convert to a GitActor without re-validation."""
+        return GitActor.from_trusted(
+            name=self.name, email=self.email, timestamp=self.timestamp
+        )
+
+
+class GitMetadataStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Mirror of GitMetadata."""
+
+    sha: str
+    author: GitActorStruct
+    committer: GitActorStruct
+    parents: list[str] = []
+    gpg_signature: str | None = None
+
+    def to_pydantic(self) -> GitMetadata:
+        """Convert to GitMetadata without re-validation."""
+        return GitMetadata.from_trusted(
+            sha=self.sha,
+            author=self.author.to_pydantic(),
+            committer=self.committer.to_pydantic(),
+            parents=self.parents,
+            gpg_signature=self.gpg_signature,
+        )
+
+
+class FileModificationStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Mirror of FileModification."""
+
+    modification_type: str
+    insertions: int
+    deletions: int
+    path_before: str | None = None
+    path_after: str | None = None
+    patch: str | None = None
+
+    def to_pydantic(self) -> FileModification:
+        """Convert to a FileModification without re-validation."""
+        # msgspec decodes fresh string objects; intern so comparisons against
+        # validated models short-circuit on identity
+        return FileModification.from_trusted(
+            modification_type=sys.intern(self.modification_type),
+            insertions=self.insertions,
+            deletions=self.deletions,
+            path_before=self.path_before,
+            path_after=self.path_after,
+            patch=self.patch,
+        )
+
+
+class DiffStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Mirror of Diff."""
+
+    files_changed_count: int
+    insertions_count: int
+    deletions_count: int
+    modifications: list[FileModificationStruct] = []
+    affected_paths: list[tuple[str | None, str | None]] = []
+
+    def to_pydantic(self) -> Diff:
+        """Convert to a Diff without re-validation."""
+        return Diff.from_trusted(
+            modifications=[mod.to_pydantic() for mod in self.modifications],
+            files_changed_count=self.files_changed_count,
+            insertions_count=self.insertions_count,
+            deletions_count=self.deletions_count,
+            affected_paths=self.affected_paths,
+        )
+
+
+class CommitStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Mirror of Commit."""
+
+    metadata: GitMetadataStruct
+    summary: str
+    message: str
+    diff: DiffStruct
+    branches: list[str] = []
+    tags: list[str] = []
+    ai_summary: str | None = None
+
+    def to_pydantic(self) -> Commit:
+        """Convert to a Commit without re-validation."""
+        return Commit.from_trusted(
+            metadata=self.metadata.to_pydantic(),
+            summary=self.summary,
+            message=self.message,
+            branches=self.branches,
+            tags=self.tags,
+            diff=self.diff.to_pydantic(),
+            ai_summary=self.ai_summary,
+        )
+
+
+_COMMIT_LIST_DECODER = msgspec.json.Decoder(list[CommitStruct])
+
+
+def decode_trusted_commits(data: bytes | str) -> list[Commit]:
+    """Decode a JSON array of previously validated commits.
+
+    Examples:
+        >>> payload = dump_commits([commit])
+        >>> decode_trusted_commits(payload)[0] == commit
+        True
+
+    Args:
+        data: JSON array of commits in ``Commit.model_dump_json()`` layout
+
+    Returns:
+        Commit instances built without re-running Pydantic validators
+
+    Raises:
+        msgspec.ValidationError: If the payload does not match the schema
+    """
+    return [commit.to_pydantic() for commit in _COMMIT_LIST_DECODER.decode(data)]
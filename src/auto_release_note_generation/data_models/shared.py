@@ -1,9 +1,22 @@
+import sys
+from collections.abc import Callable, Mapping
 from datetime import datetime
-from typing import Literal
+from functools import partial
+from itertools import chain
+from operator import attrgetter
+from typing import Any, Literal
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PrivateAttr,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import Self
 
-from .utils import GitSHA, GPGSignature
+from .utils import REF_NAME_PATTERN, GitSHA, GPGSignature
 
 
 # Validation constants to avoid magic numbers
@@ -23,14 +36,171 @@ class ValidationLimits:
     PATH_MAX_LENGTH = 4096  # Common filesystem path limit
 
 
-class GitActor(BaseModel):
-    """Represents Git author/committer information with validation and immutability."""
+# Module-level binding so validate_file_paths avoids a class lookup per path
+_PATH_MAX_LENGTH = ValidationLimits.PATH_MAX_LENGTH
+
+# Attribute getters used by Diff.from_modifications to aggregate in C
+_get_insertions = attrgetter("insertions")
+_get_deletions = attrgetter("deletions")
+_get_paths = attrgetter("path_pair")
+
+
+# Modification types that carry distinct before/after paths
+_RENAME_OR_COPY = frozenset({"R", "C"})
+
+# Allowed (min, max) source branch counts per change type, with the error
+# raised when the count falls outside them; None means unbounded
+_SOURCE_BRANCH_LIMITS: dict[str, tuple[int, int | None, str]] = {
+    # Direct-style changes have zero or one source branch
+    "direct": (0, 1, "direct changes cannot have multiple source branches"),
+    "rebase": (0, 1, "rebase changes cannot have multiple source branches"),
+    "cherry-pick": (0, 1, "cherry-pick changes cannot have multiple source branches"),
+    "revert": (0, 1, "revert changes cannot have multiple source branches"),
+    "amend": (0, 1, "amend changes cannot have multiple source branches"),
+    # Merge/squash changes need at least one source branch
+    "merge": (1, None, "merge changes require at least one source branch"),
+    "squash": (1, None, "squash changes require at least one source branch"),
+    # Octopus merges combine multiple source branches
+    "octopus": (2, None, "Octopus merges require at least two source branches"),
+    # Initial commits have no source branches
+    "initial": (0, 0, "Initial commits cannot have source branches"),
+}
+
+
+def _check_added_paths(path_before: str | None, path_after: str | None) -> None:
+    """Added files have only a path_after."""
+    if path_before is not None:
+        raise ValueError("Added files (type 'A') cannot have path_before")
+    if path_after is None:
+        raise ValueError("Added files (type 'A') must have path_after")
+
+
+def _check_deleted_paths(path_before: str | None, path_after: str | None) -> None:
+    """Deleted files have only a path_before."""
+    if path_after is not None:
+        raise ValueError("Deleted files (type 'D') cannot have path_after")
+    if path_before is None:
+        raise ValueError("Deleted files (type 'D') must have path_before")
+
+
+def _check_rename_or_copy_paths(
+    modification_type: str, path_before: str | None, path_after: str | None
+) -> None:
+    """Renamed/copied files have both paths and they differ."""
+    if path_before is None or path_after is None:
+        raise ValueError(
+            f"{modification_type} files must have both path_before and path_after"
+        )
+    if path_before == path_after:
+        raise ValueError(
+            f"{modification_type} files must have different path_before and path_after"
+        )
+
+
+def _check_modified_paths(path_before: str | None, path_after: str | None) -> None:
+    """Modified files have both paths."""
+    if path_before is None or path_after is None:
+        raise ValueError(
+            "Modified files (type 'M') must have both path_before and path_after"
+        )
+
+
+def _check_unmerged_paths(_path_before: str | None, path_after: str | None) -> None:
+    """Unmerged files have a path_after."""
+    if path_after is None:
+        raise ValueError("Unmerged files (type 'U') must have path_after")
+
+
+# Path checks per modification type; types without an entry accept any paths
+_PATH_CHECKS: dict[str, Callable[[str | None, str | None], None]] = {
+    "A": _check_added_paths,
+    "D": _check_deleted_paths,
+    "R": partial(_check_rename_or_copy_paths, "R"),
+    "C": partial(_check_rename_or_copy_paths, "C"),
+    "M": _check_modified_paths,
+    "U": _check_unmerged_paths,
+}
+
+
+def check_modification_paths(
+    modification_type: str, path_before: str | None, path_after: str | None
+) -> None:
+    """Check that the paths present match what the modification type requires.
+
+    Shared by FileModification and the dataclass mirror in ``shared_fast``.
+
+    Raises:
+        ValueError: If the path combination is invalid for the modification type
+    """
+    check = _PATH_CHECKS.get(modification_type)
+    if check is not None:
+        check(path_before, path_after)
+
+
+def check_path_pairs(path_pairs: list[tuple[str | None, str | None]]) -> None:
+    """Check that each (path_before, path_after) pair has at least one path.
+
+    Shared by Diff and the dataclass mirror in ``shared_fast``.
+
+    Raises:
+        ValueError: If a pair has neither path
+    """
+    for path_before, path_after in path_pairs:
+        if path_before is None and path_after is None:
+            raise ValueError("At least one path in each tuple must be non-None")
+
+
+def check_diff_metrics(
+    modification_count: int,
+    files_changed_count: int,
+    insertions_count: int,
+    deletions_count: int,
+) -> None:
+    """Check that non-zero aggregated counts are backed by modifications.
+
+    Raises:
+        ValueError: If counts are positive but there are no modifications
+    """
+    # Check that we have some modifications if counts > 0
+    if files_changed_count > 0 and not modification_count:
+        raise ValueError("Must have modifications if files_changed_count > 0")
+
+    if (insertions_count > 0 or deletions_count > 0) and not modification_count:
+        raise ValueError(
+            "Must have modifications if insertions_count or deletions_count > 0"
+        )
+
+
+class DerivedCacheModel(BaseModel):
+    """Base for models that cache field-derived values in ``model_post_init``.
+
+    ``model_copy(update=...)`` replaces fields without re-running
+    ``model_post_init``, so the copy would keep the original's caches; the
+    override recomputes them whenever fields are updated.
+    """
+
+    def model_copy(
+        self, *, update: Mapping[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        """Copy the model, recomputing derived caches for updated fields."""
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied.model_post_init(None)
+        return copied
+
+
+class FrozenStrippedModel(DerivedCacheModel):
+    """Base for immutable models whose string fields are whitespace-stripped."""
 
     model_config = ConfigDict(
         frozen=True,  # Makes the model immutable after creation
         str_strip_whitespace=True,  # Automatically strips whitespace
     )
 
+
+class GitActor(FrozenStrippedModel):
+    """Represents Git author/committer information with validation and immutability."""
+
     name: str = Field(
         ...,
         min_length=ValidationLimits.NAME_MIN_LENGTH,
@@ -45,17 +215,33 @@ class GitActor(BaseModel):
     )
     timestamp: datetime = Field(..., description="Timestamp of the Git action")
 
+    # Git-format string, computed once since the model is frozen
+    _str_cache: str = PrivateAttr(default="")
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Precompute the Git-format string representation."""
+        unix_timestamp = int(self.timestamp.timestamp())
+        tz_offset = self.timestamp.strftime("%z") or "+0000"
+        self._str_cache = f"{self.name} <{self.email}> {unix_timestamp} {tz_offset}"
+
     @field_validator("email")
     @classmethod
     def validate_email_format(cls, v: str) -> str:
         """Normalize email to lowercase."""
         return v.lower()
 
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "GitActor":
+        """Create a GitActor from already-validated data without re-validation.
+
+        Only use for data that previously passed validation (e.g. replayed from
+        a cache); external input must go through the regular constructor.
+        """
+        return cls.model_construct(**data)
+
     def __str__(self) -> str:
         """Returns the actor in standard Git format with timestamp."""
-        unix_timestamp = int(self.timestamp.timestamp())
-        tz_offset = self.timestamp.strftime("%z") or "+0000"
-        return f"{self.name} <{self.email}> {unix_timestamp} {tz_offset}"
+        return self._str_cache
 
     def __repr__(self) -> str:
         """Detailed representation for debugging."""
@@ -65,14 +251,9 @@ class GitActor(BaseModel):
         )
 
 
-class GitMetadata(BaseModel):
+class GitMetadata(FrozenStrippedModel):
     """Represents core immutable Git object metadata with validation."""
 
-    model_config = ConfigDict(
-        frozen=True,  # Makes the model immutable after creation
-        str_strip_whitespace=True,  # Automatically strips whitespace
-    )
-
     sha: GitSHA = Field(..., description="Git object SHA hash (4-64 characters)")
     author: GitActor = Field(..., description="Primary author of the commit")
     committer: GitActor = Field(..., description="Who committed/merged the change")
@@ -83,13 +264,39 @@ class GitMetadata(BaseModel):
         default=None, description="GPG signature for verification"
     )
 
+    # Derived values, computed once since the model is frozen
+    _is_merge_commit: bool = PrivateAttr(default=False)
+    _is_root_commit: bool = PrivateAttr(default=True)
+    _short_sha: str = PrivateAttr(default="")
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Cache the short SHA and commit-type flags derived from the parent list."""
+        self._short_sha = self.sha[:8]
+        parent_count = len(self.parents)
+        self._is_merge_commit = parent_count > 1
+        self._is_root_commit = parent_count == 0
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "GitMetadata":
+        """Create GitMetadata from already-validated data without re-validation.
+
+        Nested ``author``/``committer`` values must already be GitActor
+        instances, since no coercion is performed.
+        """
+        return cls.model_construct(**data)
+
+    @property
+    def short_sha(self) -> str:
+        """Abbreviated 8-character SHA for display purposes."""
+        return self._short_sha
+
     def is_merge_commit(self) -> bool:
         """Check if this commit is a merge commit (has multiple parents)."""
-        return len(self.parents) > 1
+        return self._is_merge_commit
 
     def is_root_commit(self) -> bool:
         """Check if this is a root commit (no parents)."""
-        return len(self.parents) == 0
+        return self._is_root_commit
 
     def __str__(self) -> str:
         """Returns the metadata in a compact format."""
@@ -102,7 +309,7 @@ class GitMetadata(BaseModel):
             parent_info = f"{parent_count} parents"
 
         gpg_info = " [signed]" if self.gpg_signature else ""
-        return f"{self.sha[:8]} ({parent_info}){gpg_info}"
+        return f"{self._short_sha} ({parent_info}){gpg_info}"
 
     def __repr__(self) -> str:
         """Detailed representation for debugging."""
@@ -113,14 +320,9 @@ class GitMetadata(BaseModel):
         )
 
 
-class ChangeMetadata(BaseModel):
+class ChangeMetadata(FrozenStrippedModel):
     """Represents metadata specific to logical changes with validation."""
 
-    model_config = ConfigDict(
-        frozen=True,  # Makes the model immutable after creation
-        str_strip_whitespace=True,  # Automatically strips whitespace
-    )
-
     change_type: Literal[
         "direct",
         "merge",
@@ -146,40 +348,58 @@ class ChangeMetadata(BaseModel):
         default=None, description="PR identifier if extractable from commit message"
     )
 
+    # Compact string, computed once since the model is frozen
+    _str_cache: str = PrivateAttr(default="")
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Precompute the compact string representation."""
+        source_info = ""
+        if self.source_branches:
+            if len(self.source_branches) == 1:
+                source_info = f" from {self.source_branches[0]}"
+            else:
+                source_info = f" from {len(self.source_branches)} branches"
+
+        pr_info = f" (PR: {self.pull_request_id})" if self.pull_request_id else ""
+        self._str_cache = (
+            f"{self.change_type}{source_info} → {self.target_branch}{pr_info}"
+        )
+
     @field_validator("source_branches")
     @classmethod
     def validate_source_branches(cls, v: list[str]) -> list[str]:
-        """Validate that all source branches are non-empty strings."""
-        for branch in v:
-            if not branch or not branch.strip():
-                raise ValueError("Source branch names must be non-empty strings")
-        return [branch.strip() for branch in v]
+        """Validate that all source branches are non-empty, whitespace-free strings."""
+        if not all(map(REF_NAME_PATTERN.fullmatch, v)):
+            invalid = [b for b in v if not REF_NAME_PATTERN.fullmatch(b)]
+            raise ValueError(
+                "Source branch names must be non-empty strings without whitespace, "
+                f"got {invalid!r}"
+            )
+        # Repositories reuse a small set of branch names; intern to share them
+        return list(map(sys.intern, v))
 
     @field_validator("target_branch")
     @classmethod
     def validate_target_branch(cls, v: str) -> str:
         """Validate target branch is non-empty and properly formatted."""
-        if not v or not v.strip():
+        # Whitespace has already been stripped by str_strip_whitespace
+        if not v:
             raise ValueError("Target branch must be a non-empty string")
 
-        stripped = v.strip()
-        # Check for invalid characters and patterns
-        if any(c in stripped for c in [" ", "\t", "\n", "\r"]):
+        # Check for invalid characters and patterns in a single C-level scan
+        if not REF_NAME_PATTERN.fullmatch(v):
             raise ValueError("Target branch cannot contain whitespace characters")
-        if stripped.startswith("/") or stripped.endswith("/") or "//" in stripped:
+        if v.startswith("/") or v.endswith("/") or "//" in v:
             raise ValueError("Target branch has invalid path format")
 
-        return stripped
+        return sys.intern(v)
 
     @field_validator("pull_request_id")
     @classmethod
     def validate_pull_request_id(cls, v: str | None) -> str | None:
         """Validate pull request ID and convert empty strings to None."""
-        if v is None:
-            return None
-        if not v.strip():
-            return None
-        return v.strip()
+        # Whitespace has already been stripped by str_strip_whitespace
+        return v or None
 
     @model_validator(mode="after")
     def validate_business_logic(self) -> "ChangeMetadata":
@@ -209,35 +429,13 @@ class ChangeMetadata(BaseModel):
         Raises:
             ValueError: When field combination violates Git workflow logic.
         """
-        # Direct-style changes should have exactly one or zero source branches
-        if (
-            self.change_type
-            in [
-                "direct",
-                "rebase",
-                "cherry-pick",
-                "revert",
-                "amend",
-            ]
-            and len(self.source_branches) > 1
-        ):
-            raise ValueError(
-                f"{self.change_type} changes cannot have multiple source branches"
-            )
-
-        # Initial commits should have no source branches
-        if self.change_type == "initial" and len(self.source_branches) > 0:
-            raise ValueError("Initial commits cannot have source branches")
-
-        # Merge/squash changes should have exactly one source branch
-        if self.change_type in ["merge", "squash"] and len(self.source_branches) == 0:
-            raise ValueError(
-                f"{self.change_type} changes require at least one source branch"
-            )
+        min_sources, max_sources, error = _SOURCE_BRANCH_LIMITS[self.change_type]
+        source_count = len(self.source_branches)
 
-        # Octopus merges should have multiple source branches
-        if self.change_type == "octopus" and len(self.source_branches) < 2:
-            raise ValueError("Octopus merges require at least two source branches")
+        if source_count < min_sources or (
+            max_sources is not None and source_count > max_sources
+        ):
+            raise ValueError(error)
 
         return self
 
@@ -247,15 +445,7 @@ class ChangeMetadata(BaseModel):
 
     def __str__(self) -> str:
         """Returns the metadata in a compact format."""
-        source_info = ""
-        if self.source_branches:
-            if len(self.source_branches) == 1:
-                source_info = f" from {self.source_branches[0]}"
-            else:
-                source_info = f" from {len(self.source_branches)} branches"
-
-        pr_info = f" (PR: {self.pull_request_id})" if self.pull_request_id else ""
-        return f"{self.change_type}{source_info} → {self.target_branch}{pr_info}"
+        return self._str_cache
 
     def __repr__(self) -> str:
         """Detailed representation for debugging."""
@@ -268,14 +458,9 @@ class ChangeMetadata(BaseModel):
         )
 
 
-class FileModification(BaseModel):
+class FileModification(FrozenStrippedModel):
     """Represents modifications to a single file with validation."""
 
-    model_config = ConfigDict(
-        frozen=True,
-        str_strip_whitespace=True,
-    )
-
     path_before: str | None = Field(
         default=None, description="File path before modification (None if added)"
     )
@@ -309,6 +494,23 @@ class FileModification(BaseModel):
         # TODO: Add patch format validation once we have more clarity
     )
 
+    # Built once so every Diff aggregating this file reuses the same tuple
+    _path_pair: tuple[str | None, str | None] = PrivateAttr(default=(None, None))
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Cache the (path_before, path_after) pair."""
+        self._path_pair = (self.path_before, self.path_after)
+
+    @property
+    def path_pair(self) -> tuple[str | None, str | None]:
+        """The (path_before, path_after) pair recorded in Diff.affected_paths."""
+        return self._path_pair
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "FileModification":
+        """Create a FileModification from validated data without re-validation."""
+        return cls.model_construct(**data)
+
     @field_validator("path_before", "path_after")
     @classmethod
     def validate_file_paths(cls, v: str | None) -> str | None:
@@ -316,17 +518,16 @@ class FileModification(BaseModel):
         if v is None:
             return None
 
-        # Normalize path separators and strip whitespace
+        # Normalize path separators and strip whitespace. str.replace is a
+        # memchr-based C loop and measures far faster than str.translate here.
         normalized = v.strip().replace("\\", "/")
 
         if not normalized:
             return None
 
         # Basic git path validation
-        if len(normalized) > ValidationLimits.PATH_MAX_LENGTH:
-            raise ValueError(
-                f"Path too long: maximum {ValidationLimits.PATH_MAX_LENGTH} characters"
-            )
+        if len(normalized) > _PATH_MAX_LENGTH:
+            raise ValueError(f"Path too long: maximum {_PATH_MAX_LENGTH} characters")
 
         # Git doesn't allow null bytes in paths
         if "\x00" in normalized:
@@ -337,47 +538,9 @@ class FileModification(BaseModel):
     @model_validator(mode="after")
     def validate_business_logic(self) -> "FileModification":
         """Validate business logic constraints between fields."""
-        # Added files should have no path_before
-        if self.modification_type == "A" and self.path_before is not None:
-            raise ValueError("Added files (type 'A') cannot have path_before")
-
-        # Deleted files should have no path_after
-        if self.modification_type == "D" and self.path_after is not None:
-            raise ValueError("Deleted files (type 'D') cannot have path_after")
-
-        # Added files must have path_after
-        if self.modification_type == "A" and self.path_after is None:
-            raise ValueError("Added files (type 'A') must have path_after")
-
-        # Deleted files must have path_before
-        if self.modification_type == "D" and self.path_before is None:
-            raise ValueError("Deleted files (type 'D') must have path_before")
-
-        # Renamed/copied files should have both paths and be different
-        if self.modification_type in ["R", "C"]:
-            if self.path_before is None or self.path_after is None:
-                raise ValueError(
-                    f"{self.modification_type} files must have both "
-                    "path_before and path_after"
-                )
-            if self.path_before == self.path_after:
-                raise ValueError(
-                    f"{self.modification_type} files must have different "
-                    "path_before and path_after"
-                )
-
-        # Modified files should have both paths
-        if self.modification_type == "M" and (
-            self.path_before is None or self.path_after is None
-        ):
-            raise ValueError(
-                "Modified files (type 'M') must have both path_before and path_after"
-            )
-
-        # Unmerged files should have path_after
-        if self.modification_type == "U" and self.path_after is None:
-            raise ValueError("Unmerged files (type 'U') must have path_after")
-
+        check_modification_paths(
+            self.modification_type, self.path_before, self.path_after
+        )
         return self
 
     def get_effective_path(self) -> str:
@@ -399,7 +562,7 @@ class FileModification(BaseModel):
 
     def is_rename_or_copy(self) -> bool:
         """Check if this modification is a rename or copy operation."""
-        return self.modification_type in ["R", "C"]
+        return self.modification_type in _RENAME_OR_COPY
 
     def __str__(self) -> str:
         """Returns the modification in a compact format."""
@@ -407,7 +570,7 @@ class FileModification(BaseModel):
             return f"A {self.path_after} (+{self.insertions})"
         if self.modification_type == "D":
             return f"D {self.path_before} (-{self.deletions})"
-        if self.modification_type in ["R", "C"]:
+        if self.modification_type in _RENAME_OR_COPY:
             return (
                 f"{self.modification_type} {self.path_before} → "
                 f"{self.path_after} (+{self.insertions}/-{self.deletions})"
@@ -426,7 +589,7 @@ class FileModification(BaseModel):
         )
 
 
-class Diff(BaseModel):
+class Diff(DerivedCacheModel):
     """Collection of file modifications with aggregated metrics."""
 
     model_config = ConfigDict(
@@ -445,73 +608,111 @@ class Diff(BaseModel):
         description="List of (path_before, path_after) tuples",
     )
 
+    # Derived values, computed once since the model is frozen
+    _by_type: dict[str, list[FileModification]] = PrivateAttr(default_factory=dict)
+    _is_empty: bool = PrivateAttr(default=True)
+    _total_changes: int = PrivateAttr(default=0)
+
+    def model_post_init(self, _context: Any, /) -> None:
+        """Group modifications by type and cache the summary metrics."""
+        by_type: dict[str, list[FileModification]] = {}
+        for mod in self.modifications:
+            by_type.setdefault(mod.modification_type, []).append(mod)
+        self._by_type = by_type
+        self._total_changes = self.insertions_count + self.deletions_count
+        self._is_empty = (
+            self.files_changed_count == 0
+            and self._total_changes == 0
+            and not self.modifications
+        )
+
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "Diff":
+        """Create a Diff from already-validated data without re-validation.
+
+        ``modifications`` must already contain FileModification instances.
+        """
+        return cls.model_construct(**data)
+
+    @classmethod
+    def from_modifications(cls, modifications: list[FileModification]) -> "Diff":
+        """Create a Diff whose aggregated metrics are derived from its modifications.
+
+        Totals are summed with ``map``/``attrgetter`` so the per-file loop runs
+        in C rather than through a generator expression.
+
+        Examples:
+            >>> mod = FileModification(
+            ...     modification_type="A", path_after="a.py", insertions=3, deletions=0
+            ... )
+            >>> Diff.from_modifications([mod]).insertions_count
+            3
+
+        Args:
+            modifications: Validated per-file modifications
+
+        Returns:
+            Diff with file, insertion and deletion counts and affected paths filled in
+        """
+        return cls(
+            modifications=modifications,
+            files_changed_count=len(modifications),
+            insertions_count=sum(map(_get_insertions, modifications)),
+            deletions_count=sum(map(_get_deletions, modifications)),
+            affected_paths=list(map(_get_paths, modifications)),
+        )
+
     @field_validator("affected_paths")
     @classmethod
-    def validate_affected_paths(
+    def validate_path_pairs(
         cls, v: list[tuple[str | None, str | None]]
     ) -> list[tuple[str | None, str | None]]:
-        """Validate affected paths format."""
-        for path_tuple in v:
-            if not isinstance(path_tuple, tuple) or len(path_tuple) != 2:
-                raise ValueError(
-                    "Each affected_paths entry must be a tuple of "
-                    "(path_before, path_after)"
-                )
-            path_before, path_after = path_tuple
-            if path_before is None and path_after is None:
-                raise ValueError("At least one path in each tuple must be non-None")
+        """Validate that each (path_before, path_after) pair has at least one path."""
+        # Pydantic has already enforced the two-tuple shape from the annotation
+        check_path_pairs(v)
         return v
 
     @model_validator(mode="after")
     def validate_aggregated_metrics(self) -> "Diff":
         """Validate that aggregated metrics are consistent."""
-        # Check that we have some modifications if counts > 0
-        if self.files_changed_count > 0 and not self.modifications:
-            raise ValueError("Must have modifications if files_changed_count > 0")
-
-        if (
-            self.insertions_count > 0 or self.deletions_count > 0
-        ) and not self.modifications:
-            raise ValueError(
-                "Must have modifications if insertions_count or deletions_count > 0"
-            )
-
+        check_diff_metrics(
+            len(self.modifications),
+            self.files_changed_count,
+            self.insertions_count,
+            self.deletions_count,
+        )
         return self
 
     def is_empty(self) -> bool:
         """Check if this diff represents no changes."""
-        return (
-            self.files_changed_count == 0
-            and self.insertions_count == 0
-            and self.deletions_count == 0
-            and len(self.modifications) == 0
-        )
+        return self._is_empty
 
     def get_total_changes(self) -> int:
         """Get total number of line changes (insertions + deletions)."""
-        return self.insertions_count + self.deletions_count
+        return self._total_changes
 
     def get_modification_types(self) -> set[str]:
         """Get unique modification types present in this diff."""
-        return {mod.modification_type for mod in self.modifications}
+        return set(self._by_type)
 
     def get_renamed_files(self) -> list[FileModification]:
         """Get all file modifications that are renames."""
-        return [mod for mod in self.modifications if mod.modification_type == "R"]
+        return list(self._by_type.get("R", ()))
 
     def get_copied_files(self) -> list[FileModification]:
         """Get all file modifications that are copies."""
-        return [mod for mod in self.modifications if mod.modification_type == "C"]
+        return list(self._by_type.get("C", ()))
 
     def get_all_affected_paths(self) -> list[str]:
         """Get a flattened list of all unique paths affected by this diff."""
-        all_paths = set()
-        for path_before, path_after in self.affected_paths:
-            if path_before is not None:
-                all_paths.add(path_before)
-            if path_after is not None:
-                all_paths.add(path_after)
-        return sorted(all_paths)
+        # Ordered dedup in C; keeping git's mostly sorted order speeds up sorted()
+        return sorted(
+            dict.fromkeys(
+                path
+                for path in chain.from_iterable(self.affected_paths)
+                if path is not None
+            )
+        )
 
     def __str__(self) -> str:
         """Returns the diff in a compact format."""
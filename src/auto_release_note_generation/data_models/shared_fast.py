@@ -0,0 +1,311 @@
+"""Slotted dataclass mirrors of the shared models for bulk ingestion.
+
+Constructing thousands of Pydantic models while walking a repository history
+is dominated by schema interpretation. These frozen, slotted dataclasses run
+the same checks as the Pydantic models (reusing the helpers in ``utils`` and
+``shared``) directly in ``__post_init__``, and convert to the Pydantic models
+through the ``from_trusted`` constructors once validated.
+
+Differences from the Pydantic models:
+    - Invalid input raises ``ValueError`` rather than ``ValidationError``.
+    - No coercion is performed: timestamps must be ``datetime`` instances,
+      counts must be ``int`` and nested values must be the record types below.
+"""
+
+import sys
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from datetime import datetime
+from operator import attrgetter
+
+from .shared import (
+    Diff,
+    FileModification,
+    GitActor,
+    GitMetadata,
+    ValidationLimits,
+    check_diff_metrics,
+    check_modification_paths,
+    check_path_pairs,
+)
+from .utils import validate_and_normalize_sha, validate_gpg_signature
+
+_NAME_MIN_LENGTH = ValidationLimits.NAME_MIN_LENGTH
+_NAME_MAX_LENGTH = ValidationLimits.NAME_MAX_LENGTH
+_EMAIL_MIN_LENGTH = ValidationLimits.EMAIL_MIN_LENGTH
+_EMAIL_MAX_LENGTH = ValidationLimits.EMAIL_MAX_LENGTH
+
+_MODIFICATION_TYPES = frozenset("ACDMRTUXB")
+
+# Single-byte codes for modification types in DiffColumns, indexed by code
+_MODIFICATION_TYPE_NAMES = "ACDMRTUXB"
+MODIFICATION_TYPE_CODES = {t: i for i, t in enumerate(_MODIFICATION_TYPE_NAMES)}
+_RENAME_CODE = MODIFICATION_TYPE_CODES["R"]
+_COPY_CODE = MODIFICATION_TYPE_CODES["C"]
+
+_get_modification_type = attrgetter("modification_type")
+_get_insertions = attrgetter("insertions")
+_get_deletions = attrgetter("deletions")
+_get_path_before = attrgetter("path_before")
+_get_path_after = attrgetter("path_after")
+_get_patch = attrgetter("patch")
+
+
+def _intern_path(path: str | None) -> str | None:
+    """Intern a path so equal before/after paths share one string object."""
+    return None if path is None else sys.intern(path)
+
+
+def _check_non_negative(field_name: str, value: int) -> None:
+    """Reject negative counts, mirroring ``Field(ge=0)``."""
+    if value < 0:
+        raise ValueError(f"{field_name} must be greater than or equal to 0")
+
+
+@dataclass(slots=True, frozen=True)
+class GitActorRecord:
+    """Validated mirror of GitActor."""
+
+    name: str
+    email: str
+    timestamp: datetime
+
+    def __post_init__(self) -> None:
+        """Strip and length-check name/email and lowercase the email."""
+        name = self.name.strip()
+        email = self.email.strip().lower()
+
+        if not _NAME_MIN_LENGTH <= len(name) <= _NAME_MAX_LENGTH:
+            raise ValueError(
+                f"name must be {_NAME_MIN_LENGTH}-{_NAME_MAX_LENGTH} characters long"
+            )
+        if not _EMAIL_MIN_LENGTH <= len(email) <= _EMAIL_MAX_LENGTH:
+            raise ValueError(
+                f"email must be {_EMAIL_MIN_LENGTH}-{_EMAIL_MAX_LENGTH} characters long"
+            )
+        if not isinstance(self.timestamp, datetime):
+            raise ValueError("timestamp must be a datetime")
+
+        object.__setattr__(self, "name", name)
+        object.__setattr__(self, "email", email)
+
+    def to_pydantic(self) -> GitActor:
+        """Convert to a GitActor without re-validation."""
+        return GitActor.from_trusted(
+            name=self.name, email=self.email, timestamp=self.timestamp
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class GitMetadataRecord:
+    """Validated mirror of GitMetadata."""
+
+    sha: str
+    author: GitActorRecord
+    committer: GitActorRecord
+    parents: list[str] = field(default_factory=list)
+    gpg_signature: str | None = None
+
+    def __post_init__(self) -> None:
+        """Normalize the SHA, parent SHAs and GPG signature."""
+        object.__setattr__(self, "sha", validate_and_normalize_sha(self.sha))
+        object.__setattr__(
+            self, "parents", [validate_and_normalize_sha(p) for p in self.parents]
+        )
+        object.__setattr__(
+            self, "gpg_signature", validate_gpg_signature(self.gpg_signature)
+        )
+
+    def to_pydantic(self) -> GitMetadata:
+        """Convert to GitMetadata without re-validation."""
+        return GitMetadata.from_trusted(
+            sha=self.sha,
+            author=self.author.to_pydantic(),
+            committer=self.committer.to_pydantic(),
+            parents=self.parents,
+            gpg_signature=self.gpg_signature,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class FileModificationRecord:
+    """Validated mirror of FileModification."""
+
+    modification_type: str
+    insertions: int
+    deletions: int
+    path_before: str | None = None
+    path_after: str | None = None
+    patch: str | None = None
+
+    def __post_init__(self) -> None:
+        """Normalize paths and check them against the modification type."""
+        if self.modification_type not in _MODIFICATION_TYPES:
+            raise ValueError(
+                f"modification_type must be one of {sorted(_MODIFICATION_TYPES)}, "
+                f"got {self.modification_type!r}"
+            )
+        _check_non_negative("insertions", self.insertions)
+        _check_non_negative("deletions", self.deletions)
+
+        path_before = FileModification.validate_file_paths(self.path_before)
+        path_after = FileModification.validate_file_paths(self.path_after)
+        check_modification_paths(self.modification_type, path_before, path_after)
+
+        object.__setattr__(self, "path_before", path_before)
+        object.__setattr__(self, "path_after", path_after)
+        if self.patch is not None:
+            object.__setattr__(self, "patch", self.patch.strip())
+
+    def to_pydantic(self) -> FileModification:
+        """Convert to a FileModification without re-validation."""
+        return FileModification.from_trusted(
+            modification_type=self.modification_type,
+            insertions=self.insertions,
+            deletions=self.deletions,
+            path_before=self.path_before,
+            path_after=self.path_after,
+            patch=self.patch,
+        )
+
+
+def _check_affected_paths(path_pairs: list[tuple[str | None, str | None]]) -> None:
+    """Check affected path pairs, including the two-tuple shape Pydantic enforces."""
+    for path_pair in path_pairs:
+        if not isinstance(path_pair, tuple) or len(path_pair) != 2:
+            raise ValueError(
+                "Each affected_paths entry must be a tuple of (path_before, path_after)"
+            )
+    check_path_pairs(path_pairs)
+
+
+@dataclass(slots=True, frozen=True)
+class DiffRecord:
+    """Validated mirror of Diff."""
+
+    files_changed_count: int
+    insertions_count: int
+    deletions_count: int
+    modifications: list[FileModificationRecord] = field(default_factory=list)
+    affected_paths: list[tuple[str | None, str | None]] = field(default_factory=list)
+
+    def __post_init__(self) -> None:
+        """Check counts and affected paths for consistency."""
+        _check_non_negative("files_changed_count", self.files_changed_count)
+        _check_non_negative("insertions_count", self.insertions_count)
+        _check_non_negative("deletions_count", self.deletions_count)
+        _check_affected_paths(self.affected_paths)
+        check_diff_metrics(
+            len(self.modifications),
+            self.files_changed_count,
+            self.insertions_count,
+            self.deletions_count,
+        )
+
+    def to_pydantic(self) -> Diff:
+        """Convert to a Diff without re-validation."""
+        return Diff.from_trusted(
+            modifications=[mod.to_pydantic() for mod in self.modifications],
+            files_changed_count=self.files_changed_count,
+            insertions_count=self.insertions_count,
+            deletions_count=self.deletions_count,
+            affected_paths=self.affected_paths,
+        )
+
+
+@dataclass(slots=True, frozen=True)
+class DiffColumns:
+    """Struct-of-arrays view of a Diff's file modifications.
+
+    Stores one column per FileModification field instead of one object per
+    file: modification types as a ``bytes`` string of single-byte codes
+    (see ``MODIFICATION_TYPE_CODES``), line counts as ``array("q")``, and
+    paths as interned strings. Aggregates then run over compact C buffers
+    rather than through Pydantic attribute access per file.
+    """
+
+    mod_types: bytes
+    insertions: "array[int]"
+    deletions: "array[int]"
+    paths_before: list[str | None]
+    paths_after: list[str | None]
+    patches: list[str | None]
+
+    @classmethod
+    def from_modifications(
+        cls, modifications: Sequence[FileModification | FileModificationRecord]
+    ) -> "DiffColumns":
+        """Build the columns from validated modifications or records."""
+        return cls(
+            mod_types=bytes(
+                map(
+                    MODIFICATION_TYPE_CODES.__getitem__,
+                    map(_get_modification_type, modifications),
+                )
+            ),
+            insertions=array("q", map(_get_insertions, modifications)),
+            deletions=array("q", map(_get_deletions, modifications)),
+            paths_before=list(map(_intern_path, map(_get_path_before, modifications))),
+            paths_after=list(map(_intern_path, map(_get_path_after, modifications))),
+            patches=list(map(_get_patch, modifications)),
+        )
+
+    def __len__(self) -> int:
+        """Number of file modifications stored."""
+        return len(self.mod_types)
+
+    def get_total_changes(self) -> int:
+        """Get total number of line changes (insertions + deletions)."""
+        return sum(self.insertions) + sum(self.deletions)
+
+    def get_modification_types(self) -> set[str]:
+        """Get unique modification types present in these columns."""
+        return {_MODIFICATION_TYPE_NAMES[code] for code in set(self.mod_types)}
+
+    def get_renamed_paths(self) -> list[tuple[str | None, str | None]]:
+        """Get (path_before, path_after) for every rename."""
+        return self._paths_for_code(_RENAME_CODE)
+
+    def get_copied_paths(self) -> list[tuple[str | None, str | None]]:
+        """Get (path_before, path_after) for every copy."""
+        return self._paths_for_code(_COPY_CODE)
+
+    def _paths_for_code(self, code: int) -> list[tuple[str | None, str | None]]:
+        """Collect path pairs for rows whose modification type matches ``code``."""
+        paths_before = self.paths_before
+        paths_after = self.paths_after
+        return [
+            (paths_before[i], paths_after[i])
+            for i, row_code in enumerate(self.mod_types)
+            if row_code == code
+        ]
+
+    def to_diff(self) -> Diff:
+        """Rebuild a Diff from the columns without re-validating each file."""
+        modifications = [
+            FileModification.from_trusted(
+                modification_type=_MODIFICATION_TYPE_NAMES[code],
+                insertions=insertions,
+                deletions=deletions,
+                path_before=path_before,
+                path_after=path_after,
+                patch=patch,
+            )
+            for code, insertions, deletions, path_before, path_after, patch in zip(
+                self.mod_types,
+                self.insertions,
+                self.deletions,
+                self.paths_before,
+                self.paths_after,
+                self.patches,
+                strict=True,
+            )
+        ]
+        return Diff.from_trusted(
+            modifications=modifications,
+            files_changed_count=len(modifications),
+            insertions_count=sum(self.insertions),
+            deletions_count=sum(self.deletions),
+            affected_paths=list(zip(self.paths_before, self.paths_after, strict=True)),
+        )
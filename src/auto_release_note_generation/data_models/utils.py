@@ -14,6 +14,20 @@ class SHAValidationLimits:
     MAX_LENGTH = 64  # Maximum Git SHA length (extended)
 
 
+# Module-level bindings so validate_and_normalize_sha avoids class lookups
+_SHA_MIN_LENGTH = SHAValidationLimits.MIN_LENGTH
+_SHA_MAX_LENGTH = SHAValidationLimits.MAX_LENGTH
+
+# Precompiled pattern for branch/tag names: non-empty, no whitespace anywhere
+REF_NAME_PATTERN = re.compile(r"\S+")
+
+# Precompiled lowercase hex pattern bounded to the valid SHA lengths; \Z avoids
+# matching before a trailing newline. For 4-64 character SHAs this measures
+# faster than frozenset.issuperset or str.translate based checks, so the regex
+# is kept deliberately.
+_SHA_HEX_PATTERN = re.compile(rf"[0-9a-f]{{{_SHA_MIN_LENGTH},{_SHA_MAX_LENGTH}}}\Z")
+
+
 def validate_and_normalize_sha(value: str) -> str:
     """Validate SHA is hexadecimal and normalize to lowercase.
 
@@ -40,17 +54,20 @@ def validate_and_normalize_sha(value: str) -> str:
     if not isinstance(value, str):
         raise ValueError("SHA must be a string")
 
+    # Fast path: SHAs from git libraries are already stripped, lowercase and
+    # valid, so return them as-is without allocating normalized copies
+    if _SHA_HEX_PATTERN.match(value):
+        return value
+
     value = value.strip().lower()
 
-    if not (
-        SHAValidationLimits.MIN_LENGTH <= len(value) <= SHAValidationLimits.MAX_LENGTH
-    ):
+    if not _SHA_MIN_LENGTH <= len(value) <= _SHA_MAX_LENGTH:
         raise ValueError(
-            f"SHA must be {SHAValidationLimits.MIN_LENGTH}-"
-            f"{SHAValidationLimits.MAX_LENGTH} characters long, got {len(value)}"
+            f"SHA must be {_SHA_MIN_LENGTH}-{_SHA_MAX_LENGTH} characters long, "
+            f"got {len(value)}"
         )
 
-    if not re.match(r"^[0-9a-f]+$", value):
+    if not _SHA_HEX_PATTERN.match(value):
         raise ValueError("SHA must contain only hexadecimal characters")
 
     return value
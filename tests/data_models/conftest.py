@@ -1,82 +1,35 @@
-"""Shared test configuration, fixtures, and utilities for data model tests."""
+"""Shared fixtures and utilities for data model tests."""
 
+import os
+from collections.abc import Callable
 from datetime import datetime, timezone
 
 import pytest
-
-# =============================================================================
-# TEST CONFIGURATION & SHARED UTILITIES
-# =============================================================================
-
-
-class SharedTestConfig:
-    """Configuration constants for all shared data model tests."""
-
-    DEFAULT_TIMESTAMP = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
-    DEFAULT_NAME = "John Doe"
-    DEFAULT_EMAIL = "john.doe@example.com"
-
-    # GitMetadata specific defaults
-    DEFAULT_SHA = "abc123def456789abcdef123456789abcdef1234"
-    DEFAULT_SHORT_SHA = "abc12345"
-    DEFAULT_PARENT_SHA = "abc123def456789abcdef123456789abcdef1235"
-    DEFAULT_GPG_SIGNATURE = None
-    DEFAULT_VALID_GPG_SIGNATURE = (
-        "-----BEGIN PGP SIGNATURE-----\nVersion: GnuPG v2\n\n"
-        "iQIcBAABCAAGBQJhXYZ1AAoJEH8JWXvNOxq+ABC123def456789abcdef123456789\n"
-        "=AbC1\n-----END PGP SIGNATURE-----"
-    )
-
-    # ChangeMetadata specific defaults
-    DEFAULT_CHANGE_TYPE = "direct"
-    DEFAULT_SOURCE_BRANCH = "feature/user-auth"
-    DEFAULT_TARGET_BRANCH = "main"
-    DEFAULT_MERGE_BASE = "abc123def456789abcdef123456789abcdef1230"
-    DEFAULT_PULL_REQUEST_ID = "42"
-
-    # ChangeMetadata constants
-    VALID_CHANGE_TYPES = [
-        "direct",
-        "merge",
-        "squash",
-        "octopus",
-        "rebase",
-        "cherry-pick",
-        "revert",
-        "initial",
-        "amend",
-    ]
-    INVALID_CHANGE_TYPES = ["invalid", "", None, "push", "pull", "fetch"]
-
-    TYPICAL_BRANCH_NAMES = [
-        "main",
-        "master",
-        "develop",
-        "feature/auth",
-        "bugfix/fix-login",
-        "hotfix/security-patch",
-        "release/v1.2.0",
-    ]
-
-    INVALID_BRANCH_NAMES = [
-        "",
-        "  ",
-        "feature with spaces",
-        "feature\nwith\nnewlines",
-        "feature\twith\ttabs",
-        "feature/",
-        "/feature",
-        "//double-slash",
-    ]
-
-    REALISTIC_PR_IDS = ["1", "42", "123", "9999", "PR-001", "pull-request-456"]
-
-    # Test patterns
-    MIN_SHA_LENGTH = 4
-    MAX_SHA_LENGTH = 64
-    TYPICAL_SHORT_SHA_LENGTH = 8
-    TYPICAL_FULL_SHA_LENGTH = 40
-
+from hypothesis import Phase, settings
+
+from auto_release_note_generation.data_models.shared import ChangeMetadata
+
+from .test_factories import (
+    ChangeMetadataFactory,
+    GitActorFactory,
+    GitMetadataFactory,
+)
+
+# Hypothesis profiles, chosen with the HYPOTHESIS_PROFILE environment variable:
+#   fast    - fewer examples per property test for a quicker local loop
+#             (FAST_TESTS=1 is a shortcut when HYPOTHESIS_PROFILE is unset)
+#   ci_fast - skip the shrink/explain phases so PR failures report at once
+#   nightly - every phase, for scheduled runs that want minimal examples
+settings.register_profile("fast", max_examples=10)
+settings.register_profile(
+    "ci_fast", phases=(Phase.explicit, Phase.reuse, Phase.generate)
+)
+settings.register_profile("nightly", phases=tuple(Phase))
+# An explicit HYPOTHESIS_PROFILE wins, so a stray FAST_TESTS cannot downgrade CI
+settings.load_profile(
+    os.environ.get("HYPOTHESIS_PROFILE")
+    or ("fast" if os.environ.get("FAST_TESTS") == "1" else "default")
+)
 
 # =============================================================================
 # SHARED TEST UTILITIES - Reusable across all data models
@@ -104,145 +57,123 @@ class TestHelpers:
 # =============================================================================
 # FIXTURES - Shared across test classes
 # =============================================================================
+# GitActor has no mutable fields, so its fixtures are built once per session
+# and shared. GitMetadata.parents and ChangeMetadata.source_branches are lists,
+# which frozen=True does not protect, so those fixtures are built per test.
+# The *_examples fixtures are parametrized, so each test receives one variant
+# at a time.
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def default_git_actor():
     """Create a default GitActor instance for testing."""
-    from .test_factories import GitActorFactory
-
     return GitActorFactory.create()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def git_actors_collection():
     """Create a collection of GitActor instances for testing."""
-    from .test_factories import GitActorFactory
-
-    return [
+    return (
         GitActorFactory.create(),
         GitActorFactory.create_with_realistic_email(),
         GitActorFactory.create_corporate_pattern(),
-    ]
+    )
+
+
+_COMMIT_TYPES = ("root", "regular", "merge", "octopus", "signed")
 
 
 @pytest.fixture
 def default_git_metadata():
     """Create a default GitMetadata instance for testing."""
-    from .test_factories import GitMetadataFactory
-
     return GitMetadataFactory.create()
 
 
 @pytest.fixture
 def git_metadata_collection():
     """Create a collection of GitMetadata instances for testing."""
-    from .test_factories import GitMetadataFactory
-
-    return [
+    return (
         GitMetadataFactory.create(),
         GitMetadataFactory.create_root_commit(),
         GitMetadataFactory.create_regular_commit(),
         GitMetadataFactory.create_merge_commit(),
-    ]
+    )
 
 
 @pytest.fixture
 def root_commit_metadata():
     """Create GitMetadata for a root commit (no parents)."""
-    from .test_factories import GitMetadataFactory
-
     return GitMetadataFactory.create_root_commit()
 
 
 @pytest.fixture
 def merge_commit_metadata():
     """Create GitMetadata for a merge commit."""
-    from .test_factories import GitMetadataFactory
-
     return GitMetadataFactory.create_merge_commit()
 
 
 @pytest.fixture
 def signed_commit_metadata():
     """Create GitMetadata with GPG signature."""
-    from .test_factories import GitMetadataFactory
-
     return GitMetadataFactory.create_signed_commit()
 
 
-@pytest.fixture
-def commit_type_examples():
-    """Create examples of different commit types."""
-    from .test_factories import GitMetadataFactory
-
-    return {
-        "root": GitMetadataFactory.create_root_commit(),
-        "regular": GitMetadataFactory.create_regular_commit(),
-        "merge": GitMetadataFactory.create_merge_commit(),
-        "octopus": GitMetadataFactory.create_octopus_merge(),
-        "signed": GitMetadataFactory.create_signed_commit(),
-    }
+@pytest.fixture(params=_COMMIT_TYPES)
+def commit_type_examples(request):
+    """Create one (name, GitMetadata) example per commit type."""
+    return request.param, GitMetadataFactory.create_from_pattern(request.param)
 
 
 @pytest.fixture
 def default_change_metadata():
     """Create a default ChangeMetadata instance for testing."""
-    from .test_factories import ChangeMetadataFactory
-
     return ChangeMetadataFactory.create()
 
 
 @pytest.fixture
 def change_metadata_collection():
     """Create a collection of ChangeMetadata instances for testing."""
-    from .test_factories import ChangeMetadataFactory
-
-    return [
+    # Consumers only read these, so the table-driven ones skip validation
+    return (
         ChangeMetadataFactory.create(),
-        ChangeMetadataFactory.create_direct_change(),
-        ChangeMetadataFactory.create_merge_change(),
-        ChangeMetadataFactory.create_octopus_change(),
-    ]
+        ChangeMetadataFactory.create_direct_change(trusted=True),
+        ChangeMetadataFactory.create_merge_change(trusted=True),
+        ChangeMetadataFactory.create_octopus_change(trusted=True),
+    )
 
 
 @pytest.fixture
 def direct_change_metadata():
     """Create ChangeMetadata for a direct change."""
-    from .test_factories import ChangeMetadataFactory
-
     return ChangeMetadataFactory.create_direct_change()
 
 
 @pytest.fixture
 def merge_change_metadata():
     """Create ChangeMetadata for a merge change."""
-    from .test_factories import ChangeMetadataFactory
-
     return ChangeMetadataFactory.create_merge_change()
 
 
 @pytest.fixture
 def octopus_change_metadata():
     """Create ChangeMetadata for an octopus merge."""
-    from .test_factories import ChangeMetadataFactory
-
     return ChangeMetadataFactory.create_octopus_change()
 
 
-@pytest.fixture
-def change_type_examples():
-    """Create examples of different change types."""
-    from .test_factories import ChangeMetadataFactory
-
-    return {
-        "direct": ChangeMetadataFactory.create_direct_change(),
-        "merge": ChangeMetadataFactory.create_merge_change(),
-        "squash": ChangeMetadataFactory.create_squash_change(),
-        "octopus": ChangeMetadataFactory.create_octopus_change(),
-        "rebase": ChangeMetadataFactory.create_rebase_change(),
-        "cherry_pick": ChangeMetadataFactory.create_cherry_pick_change(),
-        "revert": ChangeMetadataFactory.create_revert_change(),
-        "initial": ChangeMetadataFactory.create_initial_change(),
-        "amend": ChangeMetadataFactory.create_amend_change(),
-    }
+_CHANGE_TYPE_FACTORIES: dict[str, Callable[[], ChangeMetadata]] = {
+    "direct": ChangeMetadataFactory.create_direct_change,
+    "merge": ChangeMetadataFactory.create_merge_change,
+    "squash": ChangeMetadataFactory.create_squash_change,
+    "octopus": ChangeMetadataFactory.create_octopus_change,
+    "rebase": ChangeMetadataFactory.create_rebase_change,
+    "cherry_pick": ChangeMetadataFactory.create_cherry_pick_change,
+    "revert": ChangeMetadataFactory.create_revert_change,
+    "initial": ChangeMetadataFactory.create_initial_change,
+    "amend": ChangeMetadataFactory.create_amend_change,
+}
+
+
+@pytest.fixture(params=list(_CHANGE_TYPE_FACTORIES))
+def change_type_examples(request):
+    """Create one (name, ChangeMetadata) example per change type."""
+    return request.param, _CHANGE_TYPE_FACTORIES[request.param]()
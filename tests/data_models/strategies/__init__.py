@@ -17,6 +17,7 @@ from .actors import (
 )
 from .base import (
     non_empty_text,
+    nullable,
     text_with_length,
     trimmed_text,
     valid_length_filter,
@@ -27,6 +28,7 @@ from .commits import (
     merge_commit,
     root_commit,
     valid_branch_names,
+    valid_branch_names_small,
     valid_commit,
     valid_commit_message,
     valid_commit_summary,
@@ -74,6 +76,7 @@ from .utils import (
     full_git_sha,
     invalid_git_sha,
     invalid_gpg_signature,
+    present_gpg_signature,
     short_git_sha,
     valid_git_sha,
     valid_gpg_signature,
@@ -106,7 +109,9 @@ __all__ = [
     "modified_file",
     "multi_file_diff",
     "non_empty_text",
+    "nullable",
     "octopus_change",
+    "present_gpg_signature",
     "realistic_git_actors",
     "rebase_change",
     "renamed_file",
@@ -122,6 +127,7 @@ __all__ = [
     "unicode_file_path",
     "valid_branch_name",
     "valid_branch_names",
+    "valid_branch_names_small",
     "valid_change_metadata",
     "valid_commit",
     "valid_commit_message",
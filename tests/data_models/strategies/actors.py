@@ -1,6 +1,7 @@
 """Strategies for GitActor model."""
 
-from datetime import datetime
+import functools
+from datetime import datetime, timedelta, timezone
 
 from hypothesis import strategies as st
 
@@ -8,7 +9,68 @@ from auto_release_note_generation.data_models.shared import GitActor
 
 from .base import SAFE_CHARACTERS, ValidationLimits, text_with_length
 
-
+# A handful of fixed offsets (negative, half- and quarter-hour) instead of
+# st.timezones(), which loads the IANA database on every draw
+_AWARE_TIMEZONES = st.sampled_from(
+    [
+        timezone.utc,
+        timezone(timedelta(hours=9)),
+        timezone(timedelta(hours=-5)),
+        timezone(timedelta(hours=5, minutes=30)),
+        timezone(timedelta(hours=5, minutes=45)),
+    ]
+)
+_TIMESTAMP_MIN = datetime(1970, 1, 1)
+_TIMESTAMP_MAX = datetime(2100, 12, 31)
+
+# Plain local@domain.tld addresses. st.emails() generates full RFC 5321
+# syntax, which is far slower to draw and not needed since Git is permissive.
+_SIMPLE_EMAIL = st.builds(
+    lambda local, domain, tld: f"{local}@{domain}.{tld}",
+    st.text(min_size=1, max_size=20, alphabet=SAFE_CHARACTERS["alphanumeric"]),
+    st.text(min_size=1, max_size=15, alphabet=SAFE_CHARACTERS["alphanumeric"]),
+    st.sampled_from(("com", "org", "io", "dev", "net", "co.uk")),
+)
+
+_REALISTIC_NAMES = (
+    "John Doe",
+    "Jane Smith",
+    "GitHub Actions",
+    "Dependabot[bot]",
+    "renovate[bot]",
+    "José García",
+    "李明",
+    "Müller, Hans",
+    "O'Brien, Patrick",
+    "Jean-Pierre Dupont",
+)
+
+_REALISTIC_EMAILS = (
+    "john.doe@example.com",
+    "jane@company.org",
+    "actions@github.com",
+    "49699333+dependabot[bot]@users.noreply.github.com",
+    "bot@renovateapp.com",
+    "user@localhost",
+    "developer@192.168.1.1",
+    "team+project@company.com",
+)
+
+_CORPORATE_PATTERNS = (
+    ("Jenkins CI", "jenkins@ci.company.com"),
+    ("Build Bot", "buildbot@company.com"),
+    ("Release Manager", "releases@company.org"),
+    ("QA Team", "qa-team@company.com"),
+    ("Security Scanner", "security-bot@company.com"),
+    ("Merge Queue", "merge-queue@company.internal"),
+)
+
+_REALISTIC_NAMES_STRATEGY = st.sampled_from(_REALISTIC_NAMES)
+_REALISTIC_EMAILS_STRATEGY = st.sampled_from(_REALISTIC_EMAILS)
+_CORPORATE_PATTERNS_STRATEGY = st.sampled_from(_CORPORATE_PATTERNS)
+
+
+@functools.cache
 def valid_git_actor_name() -> st.SearchStrategy[str]:
     """Generate valid Git actor names.
 
@@ -21,6 +83,7 @@ def valid_git_actor_name() -> st.SearchStrategy[str]:
     )
 
 
+@functools.cache
 def valid_git_actor_email() -> st.SearchStrategy[str]:
     """Generate valid Git actor emails.
 
@@ -30,15 +93,14 @@ def valid_git_actor_email() -> st.SearchStrategy[str]:
     Returns:
         Strategy generating valid email-like strings
     """
-    # Standard email format
-    standard_email = st.emails().map(str)
-
-    # Git-style loose email format
-    git_loose_email = st.text(
-        min_size=ValidationLimits.EMAIL_MIN_LENGTH,
-        max_size=50,  # Keep reasonable for testing
-        alphabet=SAFE_CHARACTERS["email_safe"],
-    ).filter(lambda x: len(x.strip()) > 0 and "@" in x)
+    # Git-style loose email format, built around an "@" instead of filtering
+    # random text for one (the alphabet has no whitespace, so parts are non-blank)
+    email_part = st.text(
+        min_size=1, max_size=25, alphabet=SAFE_CHARACTERS["email_safe"]
+    )
+    git_loose_email = st.builds(
+        lambda local, domain: f"{local}@{domain}", email_part, email_part
+    )
 
     # Legacy/special formats Git accepts
     special_formats = st.sampled_from(
@@ -52,94 +114,56 @@ def valid_git_actor_email() -> st.SearchStrategy[str]:
         ]
     )
 
-    return st.one_of(standard_email, git_loose_email, special_formats)
+    return st.one_of(_SIMPLE_EMAIL, git_loose_email, special_formats)
 
 
-def realistic_git_actors() -> st.SearchStrategy[GitActor]:
+@functools.cache
+@st.composite
+def realistic_git_actors(draw: st.DrawFn) -> GitActor:
     """Generate GitActor instances with realistic patterns.
 
     Returns:
-        Strategy generating realistic GitActor instances
+        A realistic GitActor instance
     """
-    realistic_names = st.sampled_from(
-        [
-            "John Doe",
-            "Jane Smith",
-            "GitHub Actions",
-            "Dependabot[bot]",
-            "renovate[bot]",
-            "José García",
-            "李明",
-            "Müller, Hans",
-            "O'Brien, Patrick",
-            "Jean-Pierre Dupont",
-        ]
+    return GitActor(
+        name=draw(_REALISTIC_NAMES_STRATEGY),
+        email=draw(_REALISTIC_EMAILS_STRATEGY),
+        timestamp=draw(valid_git_timestamp()),
     )
 
-    realistic_emails = st.sampled_from(
-        [
-            "john.doe@example.com",
-            "jane@company.org",
-            "actions@github.com",
-            "49699333+dependabot[bot]@users.noreply.github.com",
-            "bot@renovateapp.com",
-            "user@localhost",
-            "developer@192.168.1.1",
-            "team+project@company.com",
-        ]
-    )
 
-    return st.builds(
-        GitActor,
-        name=realistic_names,
-        email=realistic_emails,
-        timestamp=valid_git_timestamp(),
-    )
-
-
-def corporate_actor_patterns() -> st.SearchStrategy[GitActor]:
+@functools.cache
+@st.composite
+def corporate_actor_patterns(draw: st.DrawFn) -> GitActor:
     """Generate GitActor instances with corporate patterns.
 
     Returns:
-        Strategy generating corporate-style GitActor instances
+        A corporate-style GitActor instance
     """
-    corporate_patterns = [
-        ("Jenkins CI", "jenkins@ci.company.com"),
-        ("Build Bot", "buildbot@company.com"),
-        ("Release Manager", "releases@company.org"),
-        ("QA Team", "qa-team@company.com"),
-        ("Security Scanner", "security-bot@company.com"),
-        ("Merge Queue", "merge-queue@company.internal"),
-    ]
-
-    pattern = st.sampled_from(corporate_patterns)
-
-    return pattern.flatmap(
-        lambda p: st.builds(
-            GitActor,
-            name=st.just(p[0]),
-            email=st.just(p[1]),
-            timestamp=valid_git_timestamp(),
-        )
-    )
+    name, email = draw(_CORPORATE_PATTERNS_STRATEGY)
+    return GitActor(name=name, email=email, timestamp=draw(valid_git_timestamp()))
 
 
+@functools.cache
 def valid_git_timestamp() -> st.SearchStrategy[datetime]:
     """Generate valid timestamps for Git operations.
 
     Returns:
         Strategy generating datetime objects with various timezones
     """
-    return st.datetimes(
-        min_value=datetime(1970, 1, 1),
-        max_value=datetime(2100, 12, 31),
-        timezones=st.one_of(
-            st.none(),  # Naive datetime
-            st.timezones(),  # Any timezone
+    # Naive and aware timestamps are separate branches: with naive bounds,
+    # datetimes() is typed to take either a None-only or a tzinfo-only strategy
+    return st.one_of(
+        st.datetimes(min_value=_TIMESTAMP_MIN, max_value=_TIMESTAMP_MAX),
+        st.datetimes(
+            min_value=_TIMESTAMP_MIN,
+            max_value=_TIMESTAMP_MAX,
+            timezones=_AWARE_TIMEZONES,
         ),
     )
 
 
+@functools.cache
 def valid_git_actor() -> st.SearchStrategy[GitActor]:
     """Generate valid GitActor instances.
 
@@ -154,6 +178,7 @@ def valid_git_actor() -> st.SearchStrategy[GitActor]:
     )
 
 
+@functools.cache
 def invalid_actor_data() -> st.SearchStrategy[dict[str, str | datetime]]:
     """Generate invalid data for GitActor validation testing.
 
@@ -163,13 +188,19 @@ def invalid_actor_data() -> st.SearchStrategy[dict[str, str | datetime]]:
     invalid_names = st.one_of(
         st.just(""),  # Empty
         st.just("   "),  # Whitespace only
-        st.text(min_size=256),  # Too long
+        # Too long, even after the model strips surrounding whitespace
+        st.text(min_size=ValidationLimits.NAME_MAX_LENGTH + 1).filter(
+            lambda x: len(x.strip()) > ValidationLimits.NAME_MAX_LENGTH
+        ),
     )
 
     invalid_emails = st.one_of(
         st.just(""),  # Empty
         st.just("   "),  # Whitespace only
-        st.text(min_size=321),  # Too long
+        # Too long, even after the model strips surrounding whitespace
+        st.text(min_size=ValidationLimits.EMAIL_MAX_LENGTH + 1).filter(
+            lambda x: len(x.strip()) > ValidationLimits.EMAIL_MAX_LENGTH
+        ),
     )
 
     # Generate various invalid combinations
@@ -1,6 +1,8 @@
 """Base strategies and common helpers for hypothesis testing."""
 
+import functools
 from collections.abc import Callable
+from typing import TypeVar
 
 from hypothesis import strategies as st
 
@@ -9,17 +11,21 @@ from auto_release_note_generation.data_models.utils import SHAValidationLimits
 
 # Re-export validation limits for convenience
 __all__ = [
+    "DEFAULT_ALPHABET",
     "SAFE_CHARACTERS",
     "UNICODE_CATEGORIES",
     "SHAValidationLimits",
     "ValidationLimits",
     "hex_string",
     "non_empty_text",
+    "nullable",
     "text_with_length",
     "trimmed_text",
     "valid_length_filter",
 ]
 
+T = TypeVar("T")
+
 # Character categories for text generation
 UNICODE_CATEGORIES = {
     "letters": ("Lu", "Ll", "Lt", "Lm", "Lo"),
@@ -29,10 +35,21 @@ UNICODE_CATEGORIES = {
     "separators": ("Zs", "Zl", "Zp"),
 }
 
+# Default alphabet for free-form text: anything except control characters and
+# surrogates. Built once and shared instead of per strategy call.
+DEFAULT_ALPHABET = st.characters(blacklist_categories=("Cc", "Cs"))
+
+# DEFAULT_ALPHABET without separators. Every character str.strip() removes is
+# in Cc/Zs/Zl/Zp, so text that starts and ends with a character from this
+# alphabet is never changed by strip, whatever it holds in between.
+_NONSPACE_ALPHABET = st.characters(blacklist_categories=("Cc", "Cs", "Zs", "Zl", "Zp"))
+
 # Safe character sets for various contexts
 SAFE_CHARACTERS = {
     "alphanumeric": st.characters(whitelist_categories=("Lu", "Ll", "Nd")),
     "hex": st.sampled_from("0123456789abcdefABCDEF"),
+    # Built once at import and reused by the cached path, branch and tag
+    # strategies; Hypothesis caches the resolved code point set per alphabet
     "path_safe": st.characters(
         whitelist_categories=("Lu", "Ll", "Nd"), whitelist_characters="-_./"
     ),
@@ -62,7 +79,7 @@ def non_empty_text(
         Strategy that generates non-empty strings
     """
     if alphabet is None:
-        alphabet = st.characters(blacklist_categories=("Cc", "Cs"))
+        alphabet = DEFAULT_ALPHABET
 
     return st.text(
         min_size=min_size,
@@ -71,6 +88,22 @@ def non_empty_text(
     ).filter(lambda x: len(x.strip()) > 0)
 
 
+@functools.cache
+def nullable(strategy: st.SearchStrategy[T]) -> st.SearchStrategy[T | None]:
+    """Generate None or a value from ``strategy``.
+
+    Cached per strategy, so every optional field built from the same (cached)
+    strategy shares one ``st.one_of(st.none(), ...)``.
+
+    Args:
+        strategy: Strategy for the non-None values
+
+    Returns:
+        Strategy generating None or values from ``strategy``
+    """
+    return st.one_of(st.none(), strategy)
+
+
 def trimmed_text(
     strategy: st.SearchStrategy[str],
 ) -> st.SearchStrategy[str]:
@@ -85,6 +118,30 @@ def trimmed_text(
     return strategy.map(lambda x: x.strip())
 
 
+def _strip_stable_text(min_length: int, max_length: int) -> st.SearchStrategy[str]:
+    """Generate text that str.strip() leaves unchanged, within the length bounds.
+
+    The first and last characters are never whitespace, while the middle may
+    contain spaces ("Jane Doe"), so the bounds apply directly with no
+    oversampling or filtering.
+    """
+    options: list[st.SearchStrategy[str]] = []
+    if min_length <= 0:
+        options.append(st.just(""))
+    if min_length <= 1 <= max_length:
+        options.append(_NONSPACE_ALPHABET)
+    if max_length >= 2:
+        middle = st.text(
+            min_size=max(min_length - 2, 0),
+            max_size=max_length - 2,
+            alphabet=DEFAULT_ALPHABET,
+        )
+        options.append(
+            st.tuples(_NONSPACE_ALPHABET, middle, _NONSPACE_ALPHABET).map("".join)
+        )
+    return st.one_of(options)
+
+
 def text_with_length(
     min_length: int,
     max_length: int,
@@ -101,9 +158,9 @@ def text_with_length(
         Strategy that generates strings within length bounds
     """
     if alphabet is None:
-        alphabet = st.characters(blacklist_categories=("Cc", "Cs"))
+        return _strip_stable_text(min_length, max_length)
 
-    # Generate slightly larger to account for trimming
+    # Custom alphabets may contain whitespace: oversample and filter after trimming
     return st.text(
         min_size=min_length,
         max_size=max_length + 10,  # Buffer for whitespace
@@ -1,14 +1,75 @@
 """Strategies for Commit model."""
 
+import functools
+
 from hypothesis import strategies as st
 
 from auto_release_note_generation.data_models.commit import Commit
 
-from .base import non_empty_text
+from .base import SAFE_CHARACTERS, non_empty_text
 from .files import valid_diff
 from .metadata import merge_commit_metadata, root_commit_metadata, valid_git_metadata
 
+# Alphabets and sampled values specific to commit strategies, built once at
+# import rather than on every factory call or draw
+_CC_SCOPE_ALPHABET = st.characters(
+    whitelist_categories=["Ll"], whitelist_characters="-"
+)
+_RELEASE_SUFFIX_ALPHABET = st.characters(
+    whitelist_categories=("Ll", "Nd"), whitelist_characters=".-"
+)
+_MERGE_BRANCH_ALPHABET = st.characters(
+    whitelist_categories=("Lu", "Ll", "Nd"), whitelist_characters="-_/"
+)
+
+_CC_TYPE_STRATEGY = st.sampled_from(
+    (
+        "feat",
+        "fix",
+        "docs",
+        "style",
+        "refactor",
+        "perf",
+        "test",
+        "build",
+        "ci",
+        "chore",
+        "revert",
+    )
+)
+_CC_SCOPE_STRATEGY = st.text(min_size=1, max_size=20, alphabet=_CC_SCOPE_ALPHABET)
+_CC_DESCRIPTION_STRATEGY = non_empty_text(min_size=1, max_size=50)
+_CC_BODY_STRATEGY = non_empty_text(min_size=1, max_size=200)
+_CC_ISSUE_REF_STRATEGY = st.integers(min_value=1, max_value=9999)
+
+_ROOT_SUMMARIES = st.sampled_from(
+    (
+        "Initial commit",
+        "Initialize repository",
+        "Initial import",
+        "Project initialization",
+    )
+)
+_AI_CHANGE_TYPES = st.sampled_from(("Feature", "Bug Fix", "Refactor", "Documentation"))
+_AI_IMPACT = st.sampled_from(("Low", "Medium", "High", "Critical"))
+_AI_SUMMARY_TEXT = non_empty_text(min_size=10, max_size=200)
+
+
+@functools.cache
+@st.composite
+def _optional_ai_summary(draw: st.DrawFn) -> str | None:
+    """Draw None for roughly four in five commits, otherwise an AI summary.
+
+    st.one_of(st.none(), ...) picks each branch about half the time, and
+    repeating st.none() in it does not change that, so the bias is drawn
+    explicitly. Small integers select None, so shrinking drops the summary.
+    """
+    if draw(st.integers(min_value=0, max_value=4)) < 4:
+        return None
+    return draw(_AI_SUMMARY_TEXT)
 
+
+@functools.cache
 def valid_commit_summary() -> st.SearchStrategy[str]:
     """Generate valid commit summaries (first line of message).
 
@@ -18,6 +79,7 @@ def valid_commit_summary() -> st.SearchStrategy[str]:
     return non_empty_text(min_size=1, max_size=100)
 
 
+@functools.cache
 def valid_commit_message() -> st.SearchStrategy[str]:
     """Generate valid full commit messages.
 
@@ -37,89 +99,37 @@ def valid_commit_message() -> st.SearchStrategy[str]:
     return st.one_of(single_line, multi_line)
 
 
-def conventional_commit_message() -> st.SearchStrategy[str]:
+@functools.cache
+@st.composite
+def conventional_commit_message(draw: st.DrawFn) -> str:
     """Generate conventional commit format messages.
 
     Returns:
-        Strategy generating conventional commit messages
+        A conventional commit message
     """
-    types = st.sampled_from(
-        [
-            "feat",
-            "fix",
-            "docs",
-            "style",
-            "refactor",
-            "perf",
-            "test",
-            "build",
-            "ci",
-            "chore",
-            "revert",
-        ]
-    )
-
-    scopes = st.one_of(
-        st.none(),  # No scope
-        st.text(
-            min_size=1,
-            max_size=20,
-            alphabet=st.characters(
-                whitelist_categories=["Ll"],
-                whitelist_characters="-",
-            ),
-        ),
-    )
-
-    breaking = st.booleans()
-
-    description = non_empty_text(min_size=1, max_size=50)
-
-    body = st.one_of(
-        st.just(""),  # No body
-        non_empty_text(min_size=1, max_size=200),
-    )
-
-    footer = st.one_of(
-        st.just(""),  # No footer
-        st.builds(
-            lambda ref, desc: f"Closes #{ref}: {desc}",
-            st.integers(min_value=1, max_value=9999),
-            non_empty_text(min_size=1, max_size=50),
-        ),
-    )
-
-    return st.builds(
-        lambda type_, scope, breaking, desc, body, footer: (
-            f"{type_}"
-            + (f"({scope})" if scope else "")
-            + ("!" if breaking else "")
-            + f": {desc}"
-            + (f"\n\n{body}" if body else "")
-            + (f"\n\n{footer}" if footer else "")
-        ),
-        types,
-        scopes,
-        breaking,
-        description,
-        body,
-        footer,
-    )
-
-
-def valid_branch_names() -> st.SearchStrategy[list[str]]:
-    """Generate lists of valid branch names.
-
-    Returns:
-        Strategy generating lists of branch names
-    """
-    branch_name = st.text(
+    # Collect the parts and join once instead of growing one string per part
+    parts = [draw(_CC_TYPE_STRATEGY)]
+    # Optional scope, breaking marker, body and footer
+    if draw(st.booleans()):
+        parts.append(f"({draw(_CC_SCOPE_STRATEGY)})")
+    if draw(st.booleans()):
+        parts.append("!")
+    parts.append(f": {draw(_CC_DESCRIPTION_STRATEGY)}")
+    if draw(st.booleans()):
+        parts.append(f"\n\n{draw(_CC_BODY_STRATEGY)}")
+    if draw(st.booleans()):
+        ref = draw(_CC_ISSUE_REF_STRATEGY)
+        parts.append(f"\n\nCloses #{ref}: {draw(_CC_DESCRIPTION_STRATEGY)}")
+    return "".join(parts)
+
+
+@functools.cache
+def _branch_name() -> st.SearchStrategy[str]:
+    """Generate a single valid branch name."""
+    return st.text(
         min_size=1,
         max_size=50,
-        alphabet=st.characters(
-            whitelist_categories=("Lu", "Ll", "Nd"),
-            whitelist_characters="-_/.",
-        ),
+        alphabet=SAFE_CHARACTERS["branch_safe"],
     ).filter(
         lambda x: (
             len(x.strip()) > 0
@@ -129,9 +139,31 @@ def valid_branch_names() -> st.SearchStrategy[list[str]]:
         )
     )
 
-    return st.lists(branch_name, min_size=0, max_size=5)
 
+@functools.cache
+def valid_branch_names() -> st.SearchStrategy[list[str]]:
+    """Generate lists of valid branch names.
 
+    Returns:
+        Strategy generating lists of 0-5 branch names
+    """
+    return st.lists(_branch_name(), min_size=0, max_size=5)
+
+
+@functools.cache
+def valid_branch_names_small() -> st.SearchStrategy[list[str]]:
+    """Generate short lists of valid branch names.
+
+    Used by the Commit strategies, whose tests rarely depend on the branch
+    list; fewer list sizes means fewer draws and a cheaper shrink.
+
+    Returns:
+        Strategy generating lists of 0-2 branch names
+    """
+    return st.lists(_branch_name(), min_size=0, max_size=2)
+
+
+@functools.cache
 def valid_tag_names() -> st.SearchStrategy[list[str]]:
     """Generate lists of valid tag names.
 
@@ -153,10 +185,7 @@ def valid_tag_names() -> st.SearchStrategy[list[str]]:
         st.text(
             min_size=1,
             max_size=20,
-            alphabet=st.characters(
-                whitelist_categories=("Ll", "Nd"),
-                whitelist_characters=".-",
-            ),
+            alphabet=_RELEASE_SUFFIX_ALPHABET,
         ),
     )
 
@@ -164,10 +193,7 @@ def valid_tag_names() -> st.SearchStrategy[list[str]]:
     any_tag = st.text(
         min_size=1,
         max_size=50,
-        alphabet=st.characters(
-            whitelist_categories=("Lu", "Ll", "Nd"),
-            whitelist_characters="-_./",
-        ),
+        alphabet=SAFE_CHARACTERS["path_safe"],
     ).filter(lambda x: len(x.strip()) > 0)
 
     tag_name = st.one_of(semver, release, any_tag)
@@ -175,6 +201,7 @@ def valid_tag_names() -> st.SearchStrategy[list[str]]:
     return st.lists(tag_name, min_size=0, max_size=3)
 
 
+@functools.cache
 def valid_commit() -> st.SearchStrategy[Commit]:
     """Generate valid Commit instances.
 
@@ -186,13 +213,14 @@ def valid_commit() -> st.SearchStrategy[Commit]:
         metadata=valid_git_metadata(),
         summary=valid_commit_summary(),
         message=valid_commit_message(),
-        branches=valid_branch_names(),
+        branches=valid_branch_names_small(),
         tags=valid_tag_names(),
         diff=valid_diff(),
-        ai_summary=st.one_of(st.none(), non_empty_text(min_size=10, max_size=200)),
+        ai_summary=_optional_ai_summary(),
     )
 
 
+@functools.cache
 def merge_commit() -> st.SearchStrategy[Commit]:
     """Generate merge Commit instances.
 
@@ -206,10 +234,7 @@ def merge_commit() -> st.SearchStrategy[Commit]:
             st.text(
                 min_size=1,
                 max_size=30,
-                alphabet=st.characters(
-                    whitelist_categories=("Lu", "Ll", "Nd"),
-                    whitelist_characters="-_/",
-                ),
+                alphabet=_MERGE_BRANCH_ALPHABET,
             ),
         ),
         st.builds(
@@ -224,13 +249,14 @@ def merge_commit() -> st.SearchStrategy[Commit]:
         metadata=merge_commit_metadata(),  # 2+ parents
         summary=merge_summary,
         message=valid_commit_message(),
-        branches=valid_branch_names(),
+        branches=valid_branch_names_small(),
         tags=valid_tag_names(),
         diff=valid_diff(),
-        ai_summary=st.one_of(st.none(), non_empty_text(min_size=10, max_size=200)),
+        ai_summary=_optional_ai_summary(),
     )
 
 
+@functools.cache
 def root_commit() -> st.SearchStrategy[Commit]:
     """Generate root Commit instances (initial commits).
 
@@ -239,10 +265,7 @@ def root_commit() -> st.SearchStrategy[Commit]:
     """
     # Root commits often have specific messages
     root_summary = st.one_of(
-        st.just("Initial commit"),
-        st.just("Initialize repository"),
-        st.just("Initial import"),
-        st.just("Project initialization"),
+        _ROOT_SUMMARIES,
         valid_commit_summary(),  # Or any summary
     )
 
@@ -251,13 +274,14 @@ def root_commit() -> st.SearchStrategy[Commit]:
         metadata=root_commit_metadata(),  # No parents
         summary=root_summary,
         message=valid_commit_message(),
-        branches=valid_branch_names(),
+        branches=valid_branch_names_small(),
         tags=valid_tag_names(),
         diff=valid_diff(),
         ai_summary=st.none(),  # Usually no AI summary for initial commits
     )
 
 
+@functools.cache
 def commit_with_ai_summary() -> st.SearchStrategy[Commit]:
     """Generate Commit instances with AI summaries.
 
@@ -270,9 +294,9 @@ def commit_with_ai_summary() -> st.SearchStrategy[Commit]:
             lambda type_, desc, impact: (
                 f"Type: {type_}\nDescription: {desc}\nImpact: {impact}"
             ),
-            st.sampled_from(["Feature", "Bug Fix", "Refactor", "Documentation"]),
+            _AI_CHANGE_TYPES,
             non_empty_text(min_size=10, max_size=100),
-            st.sampled_from(["Low", "Medium", "High", "Critical"]),
+            _AI_IMPACT,
         ),
         # Natural language summary
         non_empty_text(min_size=20, max_size=300),
@@ -289,7 +313,7 @@ def commit_with_ai_summary() -> st.SearchStrategy[Commit]:
         metadata=valid_git_metadata(),
         summary=valid_commit_summary(),
         message=valid_commit_message(),
-        branches=valid_branch_names(),
+        branches=valid_branch_names_small(),
         tags=valid_tag_names(),
         diff=valid_diff(),
         ai_summary=ai_summaries,
@@ -1,31 +1,43 @@
 """Strategies for FileModification and Diff models."""
 
+import functools
+
 from hypothesis import strategies as st
 
 from auto_release_note_generation.data_models.shared import Diff, FileModification
 
-from .base import SAFE_CHARACTERS, ValidationLimits
+from .base import SAFE_CHARACTERS, ValidationLimits, nullable
+
+# Removed/added line blocks for simple patches, one per line count (at most 5
+# lines are shown), so drawing a patch is a lookup rather than string building
+_PATCH_MAX_LINES = 10
+_OLD_BLOCKS = {
+    n: "".join(f"-old_line_{i}\n" for i in range(min(n, 5)))
+    for n in range(_PATCH_MAX_LINES + 1)
+}
+_NEW_BLOCKS = {
+    n: "\n".join(f"+new_line_{i}" for i in range(min(n, 5)))
+    for n in range(_PATCH_MAX_LINES + 1)
+}
 
 
+@functools.cache
 def valid_file_path() -> st.SearchStrategy[str]:
     """Generate valid file paths.
 
     Returns:
         Strategy generating valid file paths
     """
+    # path_safe has no whitespace, null bytes or backslashes, and 100 chars is
+    # far below PATH_MAX_LENGTH, so every draw is valid without filtering
     return st.text(
         min_size=1,
         max_size=100,  # Keep reasonable for testing
         alphabet=SAFE_CHARACTERS["path_safe"],
-    ).filter(
-        lambda x: (
-            len(x.strip()) > 0
-            and "\x00" not in x  # No null bytes
-            and len(x.strip().replace("\\", "/")) <= ValidationLimits.PATH_MAX_LENGTH
-        )
     )
 
 
+@functools.cache
 def unicode_file_path() -> st.SearchStrategy[str]:
     """Generate file paths with unicode characters.
 
@@ -37,22 +49,27 @@ def unicode_file_path() -> st.SearchStrategy[str]:
         whitelist_characters="/-_.αβγδεζηθικλμνξοπρστυφχψω中文日本語한글",
     )
 
+    # None of these categories contain whitespace or control characters
     return st.text(
         min_size=1,
         max_size=50,
         alphabet=unicode_chars,
-    ).filter(lambda x: len(x.strip()) > 0 and "\x00" not in x)
+    )
 
 
+@functools.cache
 def valid_line_counts() -> st.SearchStrategy[int]:
     """Generate valid line count values.
 
     Returns:
         Strategy generating non-negative integers
     """
-    return st.integers(min_value=0, max_value=10000)
+    # Lead with the 0/1 edge cases so they are drawn often and shrinking
+    # settles on them directly
+    return st.one_of(st.just(0), st.just(1), st.integers(min_value=0, max_value=10000))
 
 
+@functools.cache
 def valid_patch_content() -> st.SearchStrategy[str | None]:
     """Generate valid patch content.
 
@@ -62,13 +79,10 @@ def valid_patch_content() -> st.SearchStrategy[str | None]:
     # Simple patch format
     simple_patch = st.builds(
         lambda added, removed: (
-            f"@@ -1,{removed} +1,{added} @@\n"
-            + "\n".join([f"-old_line_{i}" for i in range(min(removed, 5))])
-            + ("\n" if removed > 0 else "")
-            + "\n".join([f"+new_line_{i}" for i in range(min(added, 5))])
+            f"@@ -1,{removed} +1,{added} @@\n{_OLD_BLOCKS[removed]}{_NEW_BLOCKS[added]}"
         ),
-        st.integers(min_value=0, max_value=10),
-        st.integers(min_value=0, max_value=10),
+        st.integers(min_value=0, max_value=_PATCH_MAX_LINES),
+        st.integers(min_value=0, max_value=_PATCH_MAX_LINES),
     )
 
     # Any non-empty text as patch
@@ -82,6 +96,15 @@ def valid_patch_content() -> st.SearchStrategy[str | None]:
 
 
 # FileModification type-specific strategies
+@functools.cache
+def _distinct_path_pair() -> st.SearchStrategy[tuple[str, ...]]:
+    """Generate two different file paths, distinct by construction."""
+    return st.lists(valid_file_path(), min_size=2, max_size=2, unique=True).map(tuple)
+
+
+# The builders below draw only the varying fields positionally and fix the
+# rest in the constructor call, rather than drawing st.just() per keyword.
+@functools.cache
 def added_file() -> st.SearchStrategy[FileModification]:
     """Generate FileModification for added files (type A).
 
@@ -89,16 +112,20 @@ def added_file() -> st.SearchStrategy[FileModification]:
         Strategy generating added file modifications
     """
     return st.builds(
-        FileModification,
-        path_before=st.none(),  # No path before
-        path_after=valid_file_path(),
-        modification_type=st.just("A"),
-        insertions=valid_line_counts(),
-        deletions=st.just(0),  # No deletions for new files
-        patch=valid_patch_content(),
+        lambda path_after, insertions, patch: FileModification(
+            modification_type="A",
+            path_after=path_after,  # No path before
+            insertions=insertions,
+            deletions=0,  # No deletions for new files
+            patch=patch,
+        ),
+        valid_file_path(),
+        valid_line_counts(),
+        valid_patch_content(),
     )
 
 
+@functools.cache
 def deleted_file() -> st.SearchStrategy[FileModification]:
     """Generate FileModification for deleted files (type D).
 
@@ -106,81 +133,88 @@ def deleted_file() -> st.SearchStrategy[FileModification]:
         Strategy generating deleted file modifications
     """
     return st.builds(
-        FileModification,
-        path_before=valid_file_path(),
-        path_after=st.none(),  # No path after
-        modification_type=st.just("D"),
-        insertions=st.just(0),  # No insertions for deleted files
-        deletions=valid_line_counts(),
-        patch=valid_patch_content(),
+        lambda path_before, deletions, patch: FileModification(
+            modification_type="D",
+            path_before=path_before,  # No path after
+            insertions=0,  # No insertions for deleted files
+            deletions=deletions,
+            patch=patch,
+        ),
+        valid_file_path(),
+        valid_line_counts(),
+        valid_patch_content(),
     )
 
 
+@functools.cache
 def modified_file() -> st.SearchStrategy[FileModification]:
     """Generate FileModification for modified files (type M).
 
     Returns:
         Strategy generating modified file modifications
     """
-    return valid_file_path().flatmap(
-        lambda path: st.builds(
-            FileModification,
-            path_before=st.just(path),
-            path_after=st.just(path),  # Same path
-            modification_type=st.just("M"),
-            insertions=valid_line_counts(),
-            deletions=valid_line_counts(),
-            patch=valid_patch_content(),
-        )
+    return st.builds(
+        lambda path, insertions, deletions, patch: FileModification(
+            modification_type="M",
+            path_before=path,
+            path_after=path,  # Same path
+            insertions=insertions,
+            deletions=deletions,
+            patch=patch,
+        ),
+        valid_file_path(),
+        valid_line_counts(),
+        valid_line_counts(),
+        valid_patch_content(),
     )
 
 
+@functools.cache
 def renamed_file() -> st.SearchStrategy[FileModification]:
     """Generate FileModification for renamed files (type R).
 
     Returns:
         Strategy generating renamed file modifications
     """
-    paths = st.tuples(valid_file_path(), valid_file_path()).filter(
-        lambda p: p[0] != p[1]  # Different paths
-    )
-
-    return paths.flatmap(
-        lambda p: st.builds(
-            FileModification,
-            path_before=st.just(p[0]),
-            path_after=st.just(p[1]),
-            modification_type=st.just("R"),
-            insertions=valid_line_counts(),
-            deletions=valid_line_counts(),
-            patch=valid_patch_content(),
-        )
+    return st.builds(
+        lambda paths, insertions, deletions, patch: FileModification(
+            modification_type="R",
+            path_before=paths[0],
+            path_after=paths[1],
+            insertions=insertions,
+            deletions=deletions,
+            patch=patch,
+        ),
+        _distinct_path_pair(),
+        valid_line_counts(),
+        valid_line_counts(),
+        valid_patch_content(),
     )
 
 
+@functools.cache
 def copied_file() -> st.SearchStrategy[FileModification]:
     """Generate FileModification for copied files (type C).
 
     Returns:
         Strategy generating copied file modifications
     """
-    paths = st.tuples(valid_file_path(), valid_file_path()).filter(
-        lambda p: p[0] != p[1]  # Different paths
-    )
-
-    return paths.flatmap(
-        lambda p: st.builds(
-            FileModification,
-            path_before=st.just(p[0]),
-            path_after=st.just(p[1]),
-            modification_type=st.just("C"),
-            insertions=valid_line_counts(),
-            deletions=st.just(0),  # Copies usually have no deletions
-            patch=valid_patch_content(),
-        )
+    return st.builds(
+        lambda paths, insertions, patch: FileModification(
+            modification_type="C",
+            path_before=paths[0],
+            path_after=paths[1],
+            insertions=insertions,
+            deletions=0,  # Copies usually have no deletions
+            patch=patch,
+        ),
+        _distinct_path_pair(),
+        valid_line_counts(),
+        valid_patch_content(),
     )
 
 
+@functools.cache
 def valid_file_modification() -> st.SearchStrategy[FileModification]:
     """Generate valid FileModification instances.
 
@@ -195,8 +229,9 @@ def valid_file_modification() -> st.SearchStrategy[FileModification]:
         copied_file(),
         # Other types (T, U, X, B) with similar logic
         st.builds(
+            # Every field is drawn here, so build the model directly
             FileModification,
-            path_before=st.one_of(st.none(), valid_file_path()),
+            path_before=nullable(valid_file_path()),
             path_after=valid_file_path(),
             modification_type=st.sampled_from(["T", "U", "X", "B"]),
             insertions=valid_line_counts(),
@@ -206,6 +241,7 @@ def valid_file_modification() -> st.SearchStrategy[FileModification]:
     )
 
 
+@functools.cache
 def invalid_file_modification_data() -> st.SearchStrategy[dict[str, str | int | None]]:
     """Generate invalid FileModification data for validation testing.
 
@@ -215,9 +251,12 @@ def invalid_file_modification_data() -> st.SearchStrategy[dict[str, str | int |
     invalid_paths = st.one_of(
         st.just(""),  # Empty
         st.just("  "),  # Whitespace only
-        st.text(min_size=4097, max_size=5000),  # Too long
-        st.text(min_size=1, max_size=20).filter(
-            lambda x: "\x00" in x  # Contains null bytes
+        # Too long; only the length is validated, so the content is irrelevant
+        st.integers(min_value=ValidationLimits.PATH_MAX_LENGTH + 1, max_value=5000).map(
+            lambda n: "a" * n
+        ),
+        st.integers(min_value=1, max_value=10).map(
+            lambda n: "a" * n + "\x00"  # Contains null bytes
         ),
     )
 
@@ -254,7 +293,7 @@ def invalid_file_modification_data() -> st.SearchStrategy[dict[str, str | int |
         # Invalid paths
         st.builds(
             dict,
-            path_before=st.one_of(st.none(), invalid_paths),
+            path_before=nullable(invalid_paths),
             path_after=invalid_paths,
             modification_type=st.sampled_from(["A", "M", "D", "R", "C"]),
             insertions=valid_line_counts(),
@@ -263,8 +302,8 @@ def invalid_file_modification_data() -> st.SearchStrategy[dict[str, str | int |
         # Negative line counts
         st.builds(
             dict,
-            path_before=st.one_of(st.none(), valid_file_path()),
-            path_after=st.one_of(st.none(), valid_file_path()),
+            path_before=nullable(valid_file_path()),
+            path_after=nullable(valid_file_path()),
             modification_type=st.sampled_from(["A", "M", "D"]),
             insertions=st.integers(max_value=-1),
             deletions=st.integers(max_value=-1),
@@ -273,40 +312,28 @@ def invalid_file_modification_data() -> st.SearchStrategy[dict[str, str | int |
 
 
 # Diff strategies
+@functools.cache
 def empty_diff() -> st.SearchStrategy[Diff]:
     """Generate empty Diff instances.
 
     Returns:
         Strategy generating empty diffs
     """
-    return st.builds(
-        Diff,
-        modifications=st.just([]),
-        files_changed_count=st.just(0),
-        insertions_count=st.just(0),
-        deletions_count=st.just(0),
-        affected_paths=st.just([]),
-    )
+    # There is only one empty diff, and Diff is frozen, so share one instance
+    return st.just(Diff.from_modifications([]))
 
 
+@functools.cache
 def single_file_diff() -> st.SearchStrategy[Diff]:
     """Generate Diff with single file modification.
 
     Returns:
         Strategy generating single-file diffs
     """
-    return valid_file_modification().flatmap(
-        lambda mod: st.builds(
-            Diff,
-            modifications=st.just([mod]),
-            files_changed_count=st.just(1),
-            insertions_count=st.just(mod.insertions),
-            deletions_count=st.just(mod.deletions),
-            affected_paths=st.just([(mod.path_before, mod.path_after)]),
-        )
-    )
+    return valid_file_modification().map(lambda mod: Diff.from_modifications([mod]))
 
 
+@functools.cache
 def multi_file_diff() -> st.SearchStrategy[Diff]:
     """Generate Diff with multiple file modifications.
 
@@ -315,18 +342,10 @@ def multi_file_diff() -> st.SearchStrategy[Diff]:
     """
     modifications = st.lists(valid_file_modification(), min_size=2, max_size=10)
 
-    return modifications.flatmap(
-        lambda mods: st.builds(
-            Diff,
-            modifications=st.just(mods),
-            files_changed_count=st.just(len(mods)),
-            insertions_count=st.just(sum(m.insertions for m in mods)),
-            deletions_count=st.just(sum(m.deletions for m in mods)),
-            affected_paths=st.just([(m.path_before, m.path_after) for m in mods]),
-        )
-    )
+    return modifications.map(Diff.from_modifications)
 
 
+@functools.cache
 def large_diff() -> st.SearchStrategy[Diff]:
     """Generate large Diff instances for stress testing.
 
@@ -335,18 +354,10 @@ def large_diff() -> st.SearchStrategy[Diff]:
     """
     modifications = st.lists(valid_file_modification(), min_size=50, max_size=100)
 
-    return modifications.flatmap(
-        lambda mods: st.builds(
-            Diff,
-            modifications=st.just(mods),
-            files_changed_count=st.just(len(mods)),
-            insertions_count=st.just(sum(m.insertions for m in mods)),
-            deletions_count=st.just(sum(m.deletions for m in mods)),
-            affected_paths=st.just([(m.path_before, m.path_after) for m in mods]),
-        )
-    )
+    return modifications.map(Diff.from_modifications)
 
 
+@functools.cache
 def valid_diff() -> st.SearchStrategy[Diff]:
     """Generate valid Diff instances.
 
@@ -1,15 +1,24 @@
 """Strategies for GitMetadata and ChangeMetadata models."""
 
+import functools
+import string
+
 from hypothesis import strategies as st
 
 from auto_release_note_generation.data_models.shared import ChangeMetadata, GitMetadata
 
 from .actors import valid_git_actor
-from .base import SAFE_CHARACTERS, ValidationLimits
-from .utils import valid_git_sha, valid_gpg_signature
+from .base import nullable
+from .utils import present_gpg_signature, valid_git_sha, valid_gpg_signature
+
+_BRANCH_SEGMENT_ALPHABET = st.characters(
+    whitelist_categories=("Lu", "Ll", "Nd"), whitelist_characters="-_."
+)
+_PR_ID_ALPHABET = st.sampled_from(tuple(string.ascii_letters + string.digits + "-_"))
 
 
 # GitMetadata Strategies
+@functools.cache
 def valid_git_metadata() -> st.SearchStrategy[GitMetadata]:
     """Generate valid GitMetadata instances.
 
@@ -26,6 +35,7 @@ def valid_git_metadata() -> st.SearchStrategy[GitMetadata]:
     )
 
 
+@functools.cache
 def root_commit_metadata() -> st.SearchStrategy[GitMetadata]:
     """Generate GitMetadata for root commits (no parents).
 
@@ -42,6 +52,7 @@ def root_commit_metadata() -> st.SearchStrategy[GitMetadata]:
     )
 
 
+@functools.cache
 def merge_commit_metadata() -> st.SearchStrategy[GitMetadata]:
     """Generate GitMetadata for merge commits (multiple parents).
 
@@ -58,6 +69,7 @@ def merge_commit_metadata() -> st.SearchStrategy[GitMetadata]:
     )
 
 
+@functools.cache
 def signed_commit_metadata() -> st.SearchStrategy[GitMetadata]:
     """Generate GitMetadata for signed commits.
 
@@ -70,32 +82,28 @@ def signed_commit_metadata() -> st.SearchStrategy[GitMetadata]:
         author=valid_git_actor(),
         committer=valid_git_actor(),
         parents=st.lists(valid_git_sha(), min_size=0, max_size=2),
-        gpg_signature=valid_gpg_signature().filter(lambda x: x is not None),
+        gpg_signature=present_gpg_signature(),
     )
 
 
 # ChangeMetadata Strategies
+@functools.cache
 def valid_branch_name() -> st.SearchStrategy[str]:
     """Generate valid Git branch names.
 
     Returns:
         Strategy generating valid branch names
     """
-    return st.text(
-        min_size=ValidationLimits.BRANCH_NAME_MIN_LENGTH,
-        max_size=100,
-        alphabet=SAFE_CHARACTERS["branch_safe"],
-    ).filter(
-        lambda x: (
-            len(x.strip()) > 0
-            and not x.startswith("/")
-            and not x.endswith("/")
-            and "//" not in x
-            and not any(c in x for c in [" ", "\t", "\n", "\r"])
-        )
-    )
+    # Join non-empty, slash-free segments with single slashes, so names never
+    # start or end with "/" or contain "//" and need no filtering
+    return st.lists(
+        st.text(min_size=1, max_size=20, alphabet=_BRANCH_SEGMENT_ALPHABET),
+        min_size=1,
+        max_size=4,
+    ).map("/".join)
 
 
+@functools.cache
 def valid_pr_id() -> st.SearchStrategy[str | None]:
     """Generate valid pull request IDs.
 
@@ -113,37 +121,68 @@ def valid_pr_id() -> st.SearchStrategy[str | None]:
             st.integers(min_value=1, max_value=9999),
         ).map(lambda x: f"{x[0]}-{x[1]}"),
         # Generic ID
-        st.text(
-            min_size=1,
-            max_size=50,
-            alphabet=st.characters(
-                whitelist_categories=("Lu", "Ll", "Nd"),
-                whitelist_characters="-_",
-            ),
-        ).filter(lambda x: len(x.strip()) > 0),
+        # No whitespace in the alphabet, so min_size=1 is enough to be non-blank
+        st.text(min_size=1, max_size=50, alphabet=_PR_ID_ALPHABET),
     )
 
-    return st.one_of(st.none(), pr_formats)
+    return nullable(pr_formats)
 
 
 # Change type specific strategies
+# change_type -> (min source branches, max source branches, has merge base/PR)
+_CHANGE_SPECS = {
+    "direct": (0, 1, True),
+    "merge": (1, 1, True),
+    "squash": (1, 1, True),
+    "octopus": (2, 8, True),
+    "rebase": (0, 1, True),
+    "cherry-pick": (0, 1, True),
+    "revert": (0, 1, True),
+    "initial": (0, 0, False),  # No source branches, merge base or PR
+    "amend": (0, 1, True),
+}
+
+
+# Shared per example and shrinks to False. Wide source-branch ranges draw
+# their full range only when it is True, so a failing octopus example can
+# drop to the minimum branch count in one shrink step.
+_USUALLY = st.shared(st.booleans(), key="usually")
+
+
+def _source_branches(min_size: int, max_size: int) -> st.SearchStrategy[list[str]]:
+    """Generate source branch lists that shrink quickly to ``min_size``."""
+    if max_size - min_size <= 1:
+        return st.lists(valid_branch_name(), min_size=min_size, max_size=max_size)
+    return _USUALLY.flatmap(
+        lambda wide: st.lists(
+            valid_branch_name(),
+            min_size=min_size,
+            max_size=max_size if wide else min_size,
+        )
+    )
+
+
+@functools.cache
+def _change_metadata(change_type: str) -> st.SearchStrategy[ChangeMetadata]:
+    """Build the ChangeMetadata strategy for one change type from its spec."""
+    min_sources, max_sources, has_history = _CHANGE_SPECS[change_type]
+    return st.builds(
+        ChangeMetadata,
+        change_type=st.just(change_type),
+        source_branches=_source_branches(min_sources, max_sources),
+        target_branch=valid_branch_name(),
+        merge_base=nullable(valid_git_sha()) if has_history else st.none(),
+        pull_request_id=valid_pr_id() if has_history else st.none(),
+    )
+
+
 def direct_change() -> st.SearchStrategy[ChangeMetadata]:
     """Generate ChangeMetadata for direct commits.
 
     Returns:
         Strategy generating direct change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("direct"),
-        source_branches=st.one_of(
-            st.just([]),  # No source
-            st.lists(valid_branch_name(), min_size=1, max_size=1),  # Single source
-        ),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("direct")
 
 
 def merge_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -152,14 +191,7 @@ def merge_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating merge change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("merge"),
-        source_branches=st.lists(valid_branch_name(), min_size=1, max_size=1),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("merge")
 
 
 def squash_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -168,14 +200,7 @@ def squash_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating squash change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("squash"),
-        source_branches=st.lists(valid_branch_name(), min_size=1, max_size=1),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("squash")
 
 
 def octopus_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -184,14 +209,7 @@ def octopus_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating octopus change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("octopus"),
-        source_branches=st.lists(valid_branch_name(), min_size=2, max_size=8),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("octopus")
 
 
 def rebase_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -200,17 +218,7 @@ def rebase_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating rebase change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("rebase"),
-        source_branches=st.one_of(
-            st.just([]),
-            st.lists(valid_branch_name(), min_size=1, max_size=1),
-        ),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("rebase")
 
 
 def cherry_pick_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -219,17 +227,7 @@ def cherry_pick_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating cherry-pick change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("cherry-pick"),
-        source_branches=st.one_of(
-            st.just([]),
-            st.lists(valid_branch_name(), min_size=1, max_size=1),
-        ),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("cherry-pick")
 
 
 def revert_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -238,17 +236,7 @@ def revert_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating revert change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("revert"),
-        source_branches=st.one_of(
-            st.just([]),
-            st.lists(valid_branch_name(), min_size=1, max_size=1),
-        ),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("revert")
 
 
 def initial_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -257,14 +245,7 @@ def initial_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating initial change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("initial"),
-        source_branches=st.just([]),  # No source branches
-        target_branch=valid_branch_name(),
-        merge_base=st.none(),  # No merge base
-        pull_request_id=st.none(),  # Usually no PR
-    )
+    return _change_metadata("initial")
 
 
 def amend_change() -> st.SearchStrategy[ChangeMetadata]:
@@ -273,19 +254,10 @@ def amend_change() -> st.SearchStrategy[ChangeMetadata]:
     Returns:
         Strategy generating amend change metadata
     """
-    return st.builds(
-        ChangeMetadata,
-        change_type=st.just("amend"),
-        source_branches=st.one_of(
-            st.just([]),
-            st.lists(valid_branch_name(), min_size=1, max_size=1),
-        ),
-        target_branch=valid_branch_name(),
-        merge_base=st.one_of(st.none(), valid_git_sha()),
-        pull_request_id=valid_pr_id(),
-    )
+    return _change_metadata("amend")
 
 
+@functools.cache
 def valid_change_metadata() -> st.SearchStrategy[ChangeMetadata]:
     """Generate valid ChangeMetadata instances.
 
@@ -305,6 +277,7 @@ def valid_change_metadata() -> st.SearchStrategy[ChangeMetadata]:
     )
 
 
+@functools.cache
 def invalid_change_metadata() -> st.SearchStrategy[dict[str, str | list[str] | None]]:
     """Generate invalid ChangeMetadata data for validation testing.
 
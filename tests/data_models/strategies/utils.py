@@ -1,23 +1,40 @@
 """Strategies for GitSHA and GPGSignature types."""
 
+import functools
+import string
+
 from hypothesis import strategies as st
 
-from .base import SHAValidationLimits, hex_string
+from .base import SHAValidationLimits, hex_string, nullable
+
+# Signature bodies are base64, plus newlines inside an armored block. The
+# armor lines or "gpgsig " prefix keep every draw valid, so nothing is filtered.
+_BASE64_CHARACTERS = string.ascii_letters + string.digits + "+/="
+_BASE64_ALPHABET = st.sampled_from(tuple(_BASE64_CHARACTERS))
+_ARMOR_ALPHABET = st.sampled_from(tuple(_BASE64_CHARACTERS + "\n"))
 
 
 # GitSHA Strategies
+@functools.cache
 def valid_git_sha() -> st.SearchStrategy[str]:
     """Generate valid Git SHA strings (4-64 hex characters).
 
     Returns:
         Strategy generating valid SHA strings
     """
-    return hex_string(
-        min_length=SHAValidationLimits.MIN_LENGTH,
-        max_length=SHAValidationLimits.MAX_LENGTH,
+    # one_of shrinks toward its first branch, so failures reduce to a canonical
+    # 40-char SHA-1 rather than an arbitrary length
+    return st.one_of(
+        full_git_sha(),
+        extended_git_sha(),
+        hex_string(
+            min_length=SHAValidationLimits.MIN_LENGTH,
+            max_length=SHAValidationLimits.MAX_LENGTH,
+        ),
     )
 
 
+@functools.cache
 def short_git_sha() -> st.SearchStrategy[str]:
     """Generate short Git SHA strings (4-12 characters).
 
@@ -30,6 +47,7 @@ def short_git_sha() -> st.SearchStrategy[str]:
     )
 
 
+@functools.cache
 def full_git_sha() -> st.SearchStrategy[str]:
     """Generate full Git SHA-1 strings (exactly 40 characters).
 
@@ -39,6 +57,7 @@ def full_git_sha() -> st.SearchStrategy[str]:
     return hex_string(min_length=40, max_length=40)
 
 
+@functools.cache
 def extended_git_sha() -> st.SearchStrategy[str]:
     """Generate extended Git SHA-256 strings (exactly 64 characters).
 
@@ -48,6 +67,7 @@ def extended_git_sha() -> st.SearchStrategy[str]:
     return hex_string(min_length=64, max_length=64)
 
 
+@functools.cache
 def invalid_git_sha() -> st.SearchStrategy[str]:
     """Generate invalid Git SHA strings for testing validation.
 
@@ -72,46 +92,48 @@ def invalid_git_sha() -> st.SearchStrategy[str]:
                 blacklist_characters="abcdefABCDEF0123456789",
             ),
         ),
-        # Mixed valid/invalid characters
-        st.text(min_size=4, max_size=64).filter(
-            lambda x: any(c not in "0123456789abcdefABCDEF" for c in x.strip())
+        # Mixed valid/invalid characters: hex around one guaranteed non-hex char
+        st.builds(
+            lambda prefix, bad, suffix: prefix + bad + suffix,
+            hex_string(min_length=0, max_length=30),
+            st.sampled_from("ghijklmnopqrstuvwxyzGHIJKLMNOPQRSTUVWXYZ!@#"),
+            hex_string(min_length=3, max_length=30),
         ),
     )
 
 
 # GPGSignature Strategies
+@functools.cache
 def valid_gpg_signature() -> st.SearchStrategy[str | None]:
     """Generate valid GPG signature strings.
 
     Returns:
         Strategy generating valid GPG signatures or None
     """
+    return nullable(present_gpg_signature())
+
+
+@functools.cache
+def present_gpg_signature() -> st.SearchStrategy[str]:
+    """Generate valid GPG signature strings, never None.
+
+    Returns:
+        Strategy generating valid GPG signatures
+    """
     # PGP signature block format
-    pgp_signature = (
-        st.text(min_size=1)
-        .filter(lambda x: x.strip())
-        .map(
-            lambda x: (
-                f"-----BEGIN PGP SIGNATURE-----\n{x.strip()}\n"
-                "-----END PGP SIGNATURE-----"
-            )
-        )
+    pgp_signature = st.text(min_size=1, max_size=200, alphabet=_ARMOR_ALPHABET).map(
+        lambda x: f"-----BEGIN PGP SIGNATURE-----\n{x}\n-----END PGP SIGNATURE-----"
     )
 
     # Git's gpgsig format
-    gpgsig_signature = (
-        st.text(min_size=1)
-        .filter(lambda x: x.strip())
-        .map(lambda x: f"gpgsig {x.strip()}")
+    gpgsig_signature = st.text(min_size=1, max_size=200, alphabet=_BASE64_ALPHABET).map(
+        lambda x: f"gpgsig {x}"
     )
 
-    return st.one_of(
-        st.none(),  # No signature
-        pgp_signature,
-        gpgsig_signature,
-    )
+    return st.one_of(pgp_signature, gpgsig_signature)
 
 
+@functools.cache
 def invalid_gpg_signature() -> st.SearchStrategy[str]:
     """Generate invalid GPG signature strings for testing validation.
 
@@ -1,12 +1,13 @@
 """Tests for ChangeMetadata data model."""
 
+import pickle
+
 import pytest
 from hypothesis import given
 from pydantic import ValidationError
 
 from auto_release_note_generation.data_models.shared import ChangeMetadata
 
-from .conftest import SharedTestConfig
 from .strategies import (
     direct_change,
     initial_change,
@@ -15,7 +16,7 @@ from .strategies import (
     octopus_change,
     valid_change_metadata,
 )
-from .test_data import ChangeTestData
+from .test_data import ChangeTestData, SharedTestConfig
 from .test_factories import ChangeMetadataFactory
 
 
@@ -103,6 +104,35 @@ class TestChangeMetadataValidation:
             with pytest.raises(ValidationError):
                 ChangeMetadataFactory.create(target_branch=invalid_branch)
 
+    @pytest.mark.parametrize(
+        "target_branch",
+        [
+            *SharedTestConfig.INVALID_BRANCH_NAMES,
+            "feature\x0bvertical-tab",
+            "feature\u3000ideographic-space",
+        ],
+    )
+    def test_invalid_target_branch_patterns(self, target_branch):
+        """Test that any embedded whitespace or bad path format is rejected."""
+        with pytest.raises(ValidationError):
+            ChangeMetadataFactory.create(target_branch=target_branch)
+
+    def test_branch_names_are_interned(self):
+        """Test that equal branch names share one string object across models."""
+        first = ChangeMetadataFactory.create(
+            change_type="merge",
+            source_branches=["".join(["feature/", "auth"])],
+            target_branch="".join(["ma", "in"]),
+        )
+        second = ChangeMetadataFactory.create(
+            change_type="merge",
+            source_branches=["".join(["feature/", "auth"])],
+            target_branch="".join(["ma", "in"]),
+        )
+
+        assert first.source_branches[0] is second.source_branches[0]
+        assert first.target_branch is second.target_branch
+
     def test_empty_source_branches_allowed(self):
         """Test that empty source branch lists are allowed."""
         metadata = ChangeMetadataFactory.create(source_branches=[])
@@ -123,6 +153,28 @@ class TestChangeMetadataValidation:
                 target_branch=target_branch,
             )
 
+    @pytest.mark.parametrize(
+        ("change_type", "source_branches", "message"),
+        [
+            ("direct", ["a", "b"], "direct changes cannot have multiple"),
+            ("amend", ["a", "b"], "amend changes cannot have multiple"),
+            ("initial", ["a"], "Initial commits cannot have source branches"),
+            ("merge", [], "merge changes require at least one source branch"),
+            ("squash", [], "squash changes require at least one source branch"),
+            ("octopus", ["a"], "Octopus merges require at least two source branches"),
+        ],
+    )
+    def test_source_branch_count_error_messages(
+        self, change_type, source_branches, message
+    ):
+        """Test that source branch count violations keep their original messages."""
+        with pytest.raises(ValidationError, match=message):
+            ChangeMetadata(
+                change_type=change_type,
+                source_branches=source_branches,
+                target_branch="main",
+            )
+
     def test_whitespace_stripping(self):
         """Test that whitespace is stripped from branch names."""
         metadata = ChangeMetadata(
@@ -152,6 +204,16 @@ class TestChangeMetadataValidation:
                 change_type="merge", source_branches=["   "], target_branch="main"
             )
 
+        # Test embedded whitespace in source branches
+        with pytest.raises(
+            ValidationError, match="Source branch names must be non-empty strings"
+        ):
+            ChangeMetadata(
+                change_type="merge",
+                source_branches=["feature branch"],
+                target_branch="main",
+            )
+
         # Test None in source branches (caught by pydantic type validation)
         with pytest.raises(ValidationError):
             ChangeMetadata(
@@ -178,6 +240,15 @@ class TestChangeMetadataValidation:
         )
         assert octopus_min.is_octopus_change() is True
 
+        # Test a change type built at runtime rather than from a literal
+        dynamic_type = "".join(["octo", "pus"])
+        dynamic_octopus = ChangeMetadata(
+            change_type=dynamic_type,  # type: ignore[arg-type]
+            source_branches=["branch1", "branch2"],
+            target_branch="main",
+        )
+        assert dynamic_octopus.is_octopus_change() is True
+
         # Test non-octopus change types
         direct_metadata = ChangeMetadata(
             change_type="direct", source_branches=[], target_branch="main"
@@ -205,30 +276,35 @@ class TestChangeMetadataBehavior:
 
     def test_immutability(self, default_change_metadata):
         """Test that ChangeMetadata is immutable after creation."""
+        # Frozen applies to every field, so one assignment probes the runtime
+        assert ChangeMetadata.model_config.get("frozen") is True
         with pytest.raises(ValidationError):
             default_change_metadata.change_type = "merge"
 
-        with pytest.raises(ValidationError):
-            default_change_metadata.source_branches = ["new/branch"]
-
-        with pytest.raises(ValidationError):
-            default_change_metadata.target_branch = "develop"
-
-    def test_string_representation_format(self):
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("direct", "direct from feature/user-auth → main"),
+            ("merge", "merge from feature/new-feature → main"),
+            ("octopus", "octopus from 3 branches → develop"),
+            ("github-pr", "squash from feature/small-fix → main (PR: 123)"),
+        ],
+    )
+    def test_string_representation_format(self, pattern, expected):
         """Test __str__ returns compact format."""
-        # Direct change
-        direct = ChangeMetadataFactory.create_direct_change(
-            source_branch="feature/auth"
-        )
-        assert str(direct) == "direct from feature/auth → main"
+        metadata = ChangeMetadataFactory.create_from_pattern(pattern)
+        assert str(metadata) == expected
 
-        # Merge change
-        merge = ChangeMetadataFactory.create_merge_change()
-        assert str(merge) == "merge from feature/new-feature → main"
+    def test_model_copy_recomputes_string(self):
+        """Test model_copy(update=...) refreshes the cached compact string."""
+        metadata = ChangeMetadata(
+            change_type="direct", source_branches=[], target_branch="main"
+        )
 
-        # Multiple branches
-        octopus = ChangeMetadataFactory.create_octopus_change(branch_count=3)
-        assert str(octopus) == "octopus from 3 branches → develop"
+        assert str(metadata.model_copy(update={"target_branch": "dev"})) == (
+            "direct → dev"
+        )
+        assert str(metadata) == "direct → main"
 
     def test_string_representation_without_source_branches(self):
         """Test __str__ handles empty source branches."""
@@ -252,13 +328,8 @@ class TestChangeMetadataBehavior:
     def test_string_methods_consistency(self, change_metadata_collection):
         """Test that str and repr work consistently across instances."""
         for metadata in change_metadata_collection:
-            str_result = str(metadata)
-            repr_result = repr(metadata)
-
-            assert isinstance(str_result, str)
-            assert len(str_result) > 0
-            assert isinstance(repr_result, str)
-            assert len(repr_result) > 0
+            assert str(metadata).startswith(metadata.change_type)
+            assert repr(metadata).startswith("ChangeMetadata(")
 
 
 class TestChangeMetadataPropertyTests:
@@ -308,7 +379,7 @@ class TestChangeMetadataEdgeCases:
 
     def test_maximum_length_fields(self):
         """Test maximum valid field lengths."""
-        long_branch = "a" * 100
+        long_branch = ChangeTestData.LONG_BRANCH_NAME
         metadata = ChangeMetadata(
             change_type="merge",
             source_branches=[long_branch],
@@ -373,22 +444,23 @@ class TestChangeMetadataEdgeCases:
         metadata = ChangeMetadataFactory.create_merge_change(merge_base=merge_base)
         assert metadata.merge_base == merge_base
 
-    def test_branch_name_special_characters(self):
-        """Test branch names with special characters."""
-        special_branches = [
+    @pytest.mark.parametrize(
+        "branch",
+        [
             "feature/user-auth",
             "bugfix/fix-login-issue",
             "release/v1.2.0",
             "hotfix/security.patch",
-        ]
-
-        for branch in special_branches:
-            metadata = ChangeMetadata(
-                change_type="merge",
-                source_branches=[branch],
-                target_branch="main",
-            )
-            assert metadata.source_branches == [branch]
+        ],
+    )
+    def test_branch_name_special_characters(self, branch):
+        """Test branch names with special characters."""
+        metadata = ChangeMetadata(
+            change_type="merge",
+            source_branches=[branch],
+            target_branch="main",
+        )
+        assert metadata.source_branches == [branch]
 
     def test_none_optional_fields(self):
         """Test that optional fields can be None."""
@@ -403,26 +475,26 @@ class TestChangeMetadataEdgeCases:
         assert metadata.merge_base is None
         assert metadata.pull_request_id is None
 
-    def test_unicode_branch_names(self):
+    @pytest.mark.parametrize("branch_name", ChangeTestData.UNICODE_BRANCH_NAMES)
+    def test_unicode_branch_names(self, branch_name):
         """Test branch names with Unicode characters."""
-        for branch_name in ChangeTestData.UNICODE_BRANCH_NAMES:
-            metadata = ChangeMetadata(
-                change_type="merge",
-                source_branches=[branch_name],
-                target_branch="main",
-            )
-            assert metadata.source_branches == [branch_name]
+        metadata = ChangeMetadata(
+            change_type="merge",
+            source_branches=[branch_name],
+            target_branch="main",
+        )
+        assert metadata.source_branches == [branch_name]
 
-    def test_realistic_pr_id_formats(self):
+    @pytest.mark.parametrize("pr_id", ChangeTestData.REALISTIC_PR_IDS)
+    def test_realistic_pr_id_formats(self, pr_id):
         """Test realistic PR ID formats from various systems."""
-        for pr_id in ChangeTestData.REALISTIC_PR_IDS:
-            metadata = ChangeMetadataFactory.create(
-                change_type="merge",
-                source_branches=["feature/test"],
-                target_branch="main",
-                pull_request_id=pr_id,
-            )
-            assert metadata.pull_request_id == pr_id
+        metadata = ChangeMetadataFactory.create(
+            change_type="merge",
+            source_branches=["feature/test"],
+            target_branch="main",
+            pull_request_id=pr_id,
+        )
+        assert metadata.pull_request_id == pr_id
 
     def test_empty_pr_id_normalization(self):
         """Test that empty PR ID becomes None."""
@@ -444,28 +516,36 @@ class TestChangeMetadataEdgeCases:
 
     def test_many_source_branches(self):
         """Test large octopus merges."""
-        many_branches = [f"feature/branch-{i}" for i in range(10)]
+        many_branches = ChangeTestData.MANY_SOURCE_BRANCHES
         metadata = ChangeMetadata(
             change_type="octopus",
-            source_branches=many_branches,
+            source_branches=list(many_branches),
             target_branch="main",
         )
-        assert len(metadata.source_branches) == 10
+        assert metadata.source_branches == list(many_branches)
 
-    def test_change_type_patterns_from_test_data(self):
+    @pytest.mark.parametrize(
+        ("change_type", "source_branches", "target", "merge_base", "pr_id"),
+        ChangeTestData.CHANGE_TYPE_PATTERNS,
+    )
+    def test_change_type_patterns_from_test_data(
+        self, change_type, source_branches, target, merge_base, pr_id
+    ):
         """Test change type patterns from ChangeTestData."""
-        for pattern in ChangeTestData.CHANGE_TYPE_PATTERNS:
-            change_type, source_branches, target, merge_base, pr_id = pattern
-            metadata = ChangeMetadata(
-                change_type=change_type,  # type: ignore[arg-type]
-                source_branches=source_branches,
-                target_branch=target,
-                merge_base=merge_base,
-                pull_request_id=pr_id,
-            )
-            assert metadata.change_type == change_type
-            assert metadata.source_branches == source_branches
-            assert metadata.target_branch == target
+        # The pattern table holds exact types, so strict mode skips coercion
+        metadata = ChangeMetadata.model_validate(
+            {
+                "change_type": change_type,
+                "source_branches": source_branches,
+                "target_branch": target,
+                "merge_base": merge_base,
+                "pull_request_id": pr_id,
+            },
+            strict=True,
+        )
+        assert metadata.change_type == change_type
+        assert metadata.source_branches == source_branches
+        assert metadata.target_branch == target
 
 
 class TestChangeMetadataFactory:
@@ -489,6 +569,46 @@ class TestChangeMetadataFactory:
         assert metadata.change_type == custom_type
         assert metadata.target_branch == SharedTestConfig.DEFAULT_TARGET_BRANCH
 
+    def test_change_type_examples_round_trip(self, change_type_examples):
+        """Test each change type example survives a dump/validate round trip."""
+        _name, metadata = change_type_examples
+
+        assert ChangeMetadata.model_validate(metadata.model_dump()) == metadata
+
+    def test_is_octopus_change_without_validation(self):
+        """Test is_octopus_change for instances that bypassed field validators."""
+        octopus = ChangeMetadataFactory.create_octopus_change(branch_count=2)
+        fresh_type = "".join(["octo", "pus"])
+        direct = ChangeMetadataFactory.create_direct_change()
+
+        rebuilt = [
+            pickle.loads(pickle.dumps(octopus)),
+            ChangeMetadata.model_construct(
+                change_type=fresh_type,
+                source_branches=list(octopus.source_branches),
+                target_branch=octopus.target_branch,
+            ),
+            direct.model_copy(
+                update={
+                    "change_type": fresh_type,
+                    "source_branches": list(octopus.source_branches),
+                }
+            ),
+        ]
+
+        for metadata in rebuilt:
+            assert metadata.is_octopus_change() is True
+
+    def test_trusted_factory_output_matches_validated(self, change_type_examples):
+        """Test trusted construction agrees with validation for every change type."""
+        name, metadata = change_type_examples
+        factory = getattr(ChangeMetadataFactory, f"create_{name}_change")
+        trusted = factory(trusted=True)
+
+        assert trusted == metadata
+        assert str(trusted) == str(metadata)
+        assert trusted.is_octopus_change() == metadata.is_octopus_change()
+
     def test_specialized_factory_methods(self):
         """Test specialized factory methods work correctly."""
         # Direct change
@@ -553,17 +673,11 @@ class TestChangeMetadataFactory:
 
     def test_factory_creates_valid_instances(self, change_metadata_collection):
         """Test that all factory methods create valid instances."""
+        # Some entries are built without validation, so re-validate each one
         for metadata in change_metadata_collection:
-            assert isinstance(metadata, ChangeMetadata)
-            assert isinstance(metadata.change_type, str)
-            assert isinstance(metadata.source_branches, list)
-            assert isinstance(metadata.target_branch, str)
-
-            # Test string methods work
-            str_result = str(metadata)
-            repr_result = repr(metadata)
-            assert isinstance(str_result, str)
-            assert isinstance(repr_result, str)
+            assert ChangeMetadata.model_validate(metadata.model_dump()) == metadata
+            assert metadata.target_branch in str(metadata)
+            assert repr(metadata).startswith("ChangeMetadata(")
 
     def test_octopus_factory_validation(self):
         """Test octopus factory validates branch count."""
@@ -574,9 +688,9 @@ class TestChangeMetadataFactory:
         octopus = ChangeMetadataFactory.create_octopus_change(branch_count=3)
         assert len(octopus.source_branches) == 3
 
-    def test_pattern_based_creation(self):
-        """Test pattern-based factory usage."""
-        patterns = [
+    @pytest.mark.parametrize(
+        "pattern",
+        [
             "direct",
             "merge",
             "squash",
@@ -589,12 +703,24 @@ class TestChangeMetadataFactory:
             "github-pr",
             "hotfix",
             "release",
-        ]
+        ],
+    )
+    def test_pattern_based_creation(self, pattern):
+        """Test pattern-based factory usage."""
+        metadata = ChangeMetadataFactory.create_from_pattern(pattern)
+        assert isinstance(metadata, ChangeMetadata)
+        # Strict pattern construction agrees with lax validation
+        assert ChangeMetadata(**metadata.model_dump()) == metadata
+
+    def test_pattern_instances_are_independent(self):
+        """Test that each pattern call builds its own source branch list."""
+        first = ChangeMetadataFactory.create_from_pattern("merge")
+        first.source_branches.append("feature/leaked")
 
-        for pattern in patterns:
-            metadata = ChangeMetadataFactory.create_from_pattern(pattern)
-            assert isinstance(metadata, ChangeMetadata)
+        second = ChangeMetadataFactory.create_from_pattern("merge")
+        assert second.source_branches == ["feature/new-feature"]
 
-        # Test invalid pattern
+    def test_invalid_pattern_rejection(self):
+        """Test that unknown patterns are rejected."""
         with pytest.raises(ValueError, match="Unknown pattern"):
             ChangeMetadataFactory.create_from_pattern("invalid_pattern")
@@ -0,0 +1,134 @@
+"""Tests for Commit data model."""
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from auto_release_note_generation.data_models.commit import Commit, dump_commits
+
+from .test_factories import CommitFactory
+
+
+class TestCommitValidation:
+    """Test Commit field validation and constraints."""
+
+    def test_whitespace_stripping(self):
+        """Test that text fields and ref names are stripped."""
+        commit = CommitFactory.create(
+            summary="  Fix login bug  ",
+            message="  Fix login bug\n\nDetails.  ",
+            branches=["  main  ", "feature/auth "],
+            tags=[" v1.0.0"],
+        )
+
+        assert commit.summary == "Fix login bug"
+        assert commit.message == "Fix login bug\n\nDetails."
+        assert commit.branches == ["main", "feature/auth"]
+        assert commit.tags == ["v1.0.0"]
+
+    def test_clean_ref_name_lists_pass_through(self):
+        """Test that already-clean branch/tag lists pass through unchanged."""
+        branches = ["main", "feature/auth"]
+        commit = CommitFactory.create(branches=branches, tags=["v1.0.0"])
+
+        assert commit.branches == branches
+        assert commit.tags == ["v1.0.0"]
+
+    @pytest.mark.parametrize("field", ["summary", "message"])
+    def test_whitespace_only_text_rejection(self, field):
+        """Test that whitespace-only summary or message is rejected."""
+        with pytest.raises(ValidationError):
+            CommitFactory.create(**{field: "   "})
+
+    @pytest.mark.parametrize("field", ["branches", "tags"])
+    @pytest.mark.parametrize("name", ["", "   ", "feature branch", "v1.0\tfinal"])
+    def test_invalid_ref_name_rejection(self, field, name):
+        """Test that empty or whitespace-containing branch/tag names are rejected."""
+        with pytest.raises(ValidationError, match="cannot be empty or contain"):
+            CommitFactory.create(**{field: ["valid", name]})
+
+
+class TestCommitBehavior:
+    """Test Commit behavior and helper methods."""
+
+    def test_from_trusted_skips_validation(self):
+        """Test from_trusted rebuilds an equal commit from validated data."""
+        commit = CommitFactory.create()
+        trusted = Commit.from_trusted(**dict(commit))
+
+        assert trusted == commit
+        assert trusted.metadata is commit.metadata
+        assert str(trusted) == str(commit)
+
+    @pytest.mark.parametrize(
+        ("length", "expected"), [(8, "abc123de"), (4, "abc1"), (12, "abc123def456")]
+    )
+    def test_get_short_sha(self, length, expected):
+        """Test get_short_sha for the cached default and arbitrary lengths."""
+        commit = CommitFactory.create()
+        assert commit.get_short_sha(length) == expected
+
+    def test_has_ai_summary(self):
+        """Test has_ai_summary for constructed and assigned ai_summary values."""
+        commit = CommitFactory.create()
+        assert commit.has_ai_summary() is False
+
+        commit.ai_summary = "  Adds OAuth login  "
+        assert commit.has_ai_summary() is True
+
+        assert CommitFactory.create(ai_summary="\n\t").has_ai_summary() is False
+
+    def test_blank_ai_summary_assignment_not_counted(self):
+        """Test blank summaries assigned after construction are not reported."""
+        commit = CommitFactory.create(ai_summary="Adds OAuth login")
+        commit.ai_summary = "   "
+        assert commit.has_ai_summary() is False
+
+        commit.ai_summary = ""
+        assert commit.has_ai_summary() is False
+
+    def test_assignment_is_not_validated(self):
+        """Test fields assigned after construction are stored as given."""
+        commit = CommitFactory.create()
+        commit.summary = ""
+
+        assert commit.summary == ""
+
+    def test_string_representation_format(self):
+        """Test __str__ returns compact log format."""
+        commit = CommitFactory.create()
+        assert str(commit) == "abc123de Add user authentication (1 file)"
+
+        commit.ai_summary = "Adds OAuth login"
+        assert str(commit) == "abc123de Add user authentication (1 file) [AI]"
+
+    def test_string_representation_truncates_summary(self):
+        """Test __str__ truncates summaries longer than 50 characters."""
+        commit = CommitFactory.create(summary="x" * 60)
+        assert str(commit) == f"abc123de {'x' * 50}... (1 file)"
+
+    def test_repr_format(self):
+        """Test __repr__ returns detailed representation."""
+        commit = CommitFactory.create()
+        assert repr(commit) == (
+            "Commit(sha='abc123de', author='John Doe', "
+            "summary='Add user authentication...', branches=1, tags=0, "
+            "files_changed=1, ai_summary=No)"
+        )
+
+
+class TestDumpCommits:
+    """Test bulk JSON serialization of commits."""
+
+    def test_matches_per_commit_serialization(self):
+        """Test dump_commits produces the same data as model_dump_json per commit."""
+        commits = [CommitFactory.create(), CommitFactory.create(ai_summary="AI")]
+
+        dumped = json.loads(dump_commits(commits))
+
+        assert dumped == [json.loads(c.model_dump_json()) for c in commits]
+
+    def test_empty_list(self):
+        """Test dump_commits handles an empty list."""
+        assert dump_commits([]) == b"[]"
@@ -1,4 +1,75 @@
-"""Test data collections organized by domain."""
+"""Test configuration and data collections organized by domain."""
+
+from datetime import datetime, timezone
+
+
+class SharedTestConfig:
+    """Configuration constants for all shared data model tests."""
+
+    DEFAULT_TIMESTAMP = datetime(2023, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    DEFAULT_NAME = "John Doe"
+    DEFAULT_EMAIL = "john.doe@example.com"
+
+    # GitMetadata specific defaults
+    DEFAULT_SHA = "abc123def456789abcdef123456789abcdef1234"
+    DEFAULT_SHORT_SHA = "abc12345"
+    DEFAULT_PARENT_SHA = "abc123def456789abcdef123456789abcdef1235"
+    DEFAULT_GPG_SIGNATURE = None
+    DEFAULT_VALID_GPG_SIGNATURE = (
+        "-----BEGIN PGP SIGNATURE-----\nVersion: GnuPG v2\n\n"
+        "iQIcBAABCAAGBQJhXYZ1AAoJEH8JWXvNOxq+ABC123def456789abcdef123456789\n"
+        "=AbC1\n-----END PGP SIGNATURE-----"
+    )
+
+    # ChangeMetadata specific defaults
+    DEFAULT_CHANGE_TYPE = "direct"
+    DEFAULT_SOURCE_BRANCH = "feature/user-auth"
+    DEFAULT_TARGET_BRANCH = "main"
+    DEFAULT_MERGE_BASE = "abc123def456789abcdef123456789abcdef1230"
+    DEFAULT_PULL_REQUEST_ID = "42"
+
+    # ChangeMetadata constants
+    VALID_CHANGE_TYPES = [
+        "direct",
+        "merge",
+        "squash",
+        "octopus",
+        "rebase",
+        "cherry-pick",
+        "revert",
+        "initial",
+        "amend",
+    ]
+    INVALID_CHANGE_TYPES = ["invalid", "", None, "push", "pull", "fetch"]
+
+    TYPICAL_BRANCH_NAMES = [
+        "main",
+        "master",
+        "develop",
+        "feature/auth",
+        "bugfix/fix-login",
+        "hotfix/security-patch",
+        "release/v1.2.0",
+    ]
+
+    INVALID_BRANCH_NAMES = [
+        "",
+        "  ",
+        "feature with spaces",
+        "feature\nwith\nnewlines",
+        "feature\twith\ttabs",
+        "feature/",
+        "/feature",
+        "//double-slash",
+    ]
+
+    REALISTIC_PR_IDS = ["1", "42", "123", "9999", "PR-001", "pull-request-456"]
+
+    # Test patterns
+    MIN_SHA_LENGTH = 4
+    MAX_SHA_LENGTH = 64
+    TYPICAL_SHORT_SHA_LENGTH = 8
+    TYPICAL_FULL_SHA_LENGTH = 40
 
 
 class GitTestData:
@@ -85,7 +156,9 @@ class ChangeTestData:
 
     # Real-world change type patterns
     # (change_type, source_branches, target, merge_base, pr_id)
-    CHANGE_TYPE_PATTERNS = [
+    CHANGE_TYPE_PATTERNS: tuple[
+        tuple[str, list[str], str, str | None, str | None], ...
+    ] = (
         # Direct commits (no merge)
         ("direct", [], "main", None, None),
         ("direct", [], "develop", None, "456"),
@@ -123,46 +196,46 @@ class ChangeTestData:
         # Amended commits (git commit --amend)
         ("amend", [], "feature/fix", None, None),
         ("amend", ["original-branch"], "main", "abc123def456", "amended-pr"),
-    ]
+    )
 
     # Realistic branch name patterns
-    COMMON_BRANCHES = ["main", "master", "develop", "staging", "production"]
+    COMMON_BRANCHES = ("main", "master", "develop", "staging", "production")
 
-    FEATURE_BRANCHES = [
+    FEATURE_BRANCHES = (
         "feature/user-authentication",
         "feature/payment-integration",
         "feature/api-v2",
         "feat/mobile-app",
         "features/dashboard-redesign",
-    ]
+    )
 
-    BUGFIX_BRANCHES = [
+    BUGFIX_BRANCHES = (
         "bugfix/login-issue",
         "bugfix/memory-leak",
         "fix/security-vulnerability",
         "hotfix/critical-bug",
         "bug/ui-rendering",
-    ]
+    )
 
-    RELEASE_BRANCHES = [
+    RELEASE_BRANCHES = (
         "release/v1.0.0",
         "release/v2.1.3",
         "rel/sprint-42",
         "releases/q4-2023",
-    ]
+    )
 
     # Corporate patterns
-    CORPORATE_BRANCH_PATTERNS = [
+    CORPORATE_BRANCH_PATTERNS = (
         "users/john.doe/experimental-feature",
         "teams/backend/database-migration",
         "releases/sprint-42",
         "environments/staging-deployment",
         "projects/mobile-app/feature-auth",
         "departments/security/audit-fixes",
-    ]
+    )
 
     # Edge case patterns
-    EDGE_CASE_BRANCH_NAMES = [
+    EDGE_CASE_BRANCH_NAMES = (
         "a",  # Minimum length
         "feature-with-dashes",
         "feature_with_underscores",
@@ -187,46 +260,46 @@ class ChangeTestData:
         "ci/add-security-scanning",  # CI/CD branches
         "perf/optimize-database-queries",  # Performance branches
         "feat/PROJ-456-user-management",  # Feature with project prefix
-    ]
+    )
 
     # Unicode and international branch names
-    UNICODE_BRANCH_NAMES = [
+    UNICODE_BRANCH_NAMES = (
         "feature/测试",  # Chinese
         "bugfix/тест",  # Russian
         "release/한국어",  # Korean
         "hotfix/العربية",  # Arabic
         "feature/日本語",  # Japanese
-    ]
+    )
 
     # Real-world change patterns
-    DIRECT_CHANGE_PATTERNS = [
+    DIRECT_CHANGE_PATTERNS = (
         # Single-branch direct commits
         (["main"], "main"),
         (["develop"], "develop"),
         (["hotfix/critical"], "main"),
-    ]
+    )
 
-    MERGE_CHANGE_PATTERNS = [
+    MERGE_CHANGE_PATTERNS = (
         # Feature merges
         (["feature/auth"], "develop"),
         (["feature/payment", "feature/ui"], "main"),
         (["bugfix/security"], "main"),
-    ]
+    )
 
-    SQUASH_CHANGE_PATTERNS = [
+    SQUASH_CHANGE_PATTERNS = (
         # Squash merges common in GitHub workflow
         (["feature/small-fix"], "main"),
         (["fix/typo"], "develop"),
-    ]
+    )
 
-    OCTOPUS_CHANGE_PATTERNS = [
+    OCTOPUS_CHANGE_PATTERNS = (
         # Multi-branch octopus merges
         (["feature/a", "feature/b", "feature/c"], "develop"),
         (["hotfix/p1", "hotfix/p2", "bugfix/minor"], "main"),
-    ]
+    )
 
     # Invalid combinations for testing validation
-    INVALID_COMBINATIONS = [
+    INVALID_COMBINATIONS: tuple[tuple[list[str], str, str], ...] = (
         # Empty source branches should fail for merge/squash
         ([], "develop", "merge"),
         ([], "main", "squash"),
@@ -241,15 +314,15 @@ class ChangeTestData:
         # Initial commits with source branches should fail
         (["feature/branch"], "main", "initial"),
         (["main"], "main", "initial"),
-    ]
+    )
 
     # Pull request ID patterns
-    GITHUB_PR_PATTERNS = ["1", "42", "123", "9999"]
-    GITLAB_MR_PATTERNS = ["!1", "!42", "!123"]
-    CUSTOM_PR_PATTERNS = ["PR-001", "MR-042", "pull-request-123"]
+    GITHUB_PR_PATTERNS = ("1", "42", "123", "9999")
+    GITLAB_MR_PATTERNS = ("!1", "!42", "!123")
+    CUSTOM_PR_PATTERNS = ("PR-001", "MR-042", "pull-request-123")
 
     # Comprehensive PR ID patterns from various systems
-    REALISTIC_PR_IDS = [
+    REALISTIC_PR_IDS = (
         "1",
         "42",
         "123",
@@ -266,14 +339,18 @@ class ChangeTestData:
         "ISSUE-789",  # Issue tracker
         "feature-request-001",
         "hotfix-urgent",  # Descriptive
-    ]
+    )
 
     # Merge base patterns (SHA where branches diverged)
-    MERGE_BASE_PATTERNS = [
+    MERGE_BASE_PATTERNS = (
         "abc123def456789abcdef123456789abcdef1230",
         "def456abc789def123abc456def789abc123ab",
         "123456789abcdef123456789abcdef123456789",
-    ]
+    )
+
+    # Size edge cases
+    LONG_BRANCH_NAME = "a" * 100
+    MANY_SOURCE_BRANCHES = tuple(f"feature/branch-{i}" for i in range(10))
 
 
 class FileTestData:
@@ -3,6 +3,7 @@
 from collections.abc import Callable
 from typing import Any
 
+from auto_release_note_generation.data_models.commit import Commit
 from auto_release_note_generation.data_models.shared import (
     ChangeMetadata,
     Diff,
@@ -11,8 +12,77 @@ from auto_release_note_generation.data_models.shared import (
     GitMetadata,
 )
 
-from .conftest import SharedTestConfig
-from .test_data import FileTestData, GitTestData
+from .test_data import FileTestData, GitTestData, SharedTestConfig
+
+__all__ = [
+    "ChangeMetadataFactory",
+    "CommitFactory",
+    "DiffFactory",
+    "FileModificationFactory",
+    "GitActorFactory",
+    "GitMetadataFactory",
+]
+
+
+# Defaults for each ChangeMetadataFactory.create_*_change helper, keyed on
+# change_type. source_branches is copied per call; a source_branch argument
+# replaces it with a single branch.
+_CHANGE_DEFAULTS: dict[str, dict[str, Any]] = {
+    "direct": {
+        "source_branches": (SharedTestConfig.DEFAULT_SOURCE_BRANCH,),
+        "target_branch": SharedTestConfig.DEFAULT_TARGET_BRANCH,
+        "merge_base": None,  # Direct changes don't have merge base
+        "pull_request_id": None,  # Direct changes typically don't have PR IDs
+    },
+    "merge": {
+        "source_branches": ("feature/new-feature",),
+        "target_branch": "main",
+        "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
+        "pull_request_id": None,  # Let tests specify PR ID explicitly
+    },
+    "squash": {
+        "source_branches": ("feature/small-fix",),
+        "target_branch": "main",
+        "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
+        "pull_request_id": SharedTestConfig.DEFAULT_PULL_REQUEST_ID,
+    },
+    "octopus": {
+        "source_branches": (),  # Built from branch_count
+        "target_branch": "develop",
+        "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
+        "pull_request_id": None,
+    },
+    "rebase": {
+        "source_branches": ("feature/rebased-branch",),
+        "target_branch": "main",
+        "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
+        "pull_request_id": None,  # Rebases typically don't have PR IDs
+    },
+    "cherry-pick": {
+        "source_branches": ("hotfix/cherry-picked",),
+        "target_branch": "main",
+        "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
+        "pull_request_id": None,
+    },
+    "revert": {
+        "source_branches": ("bad-commit",),
+        "target_branch": "main",
+        "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
+        "pull_request_id": None,
+    },
+    "initial": {
+        "source_branches": (),  # Initial commits have no source branches
+        "target_branch": "main",
+        "merge_base": None,
+        "pull_request_id": None,
+    },
+    "amend": {
+        "source_branches": (),
+        "target_branch": "feature/fix",
+        "merge_base": None,
+        "pull_request_id": None,
+    },
+}
 
 
 class GitActorFactory:
@@ -163,177 +233,199 @@ class ChangeMetadataFactory:
 
         return ChangeMetadata(**defaults)
 
+    @staticmethod
+    def _trusted(**kwargs: Any) -> ChangeMetadata:
+        """Build ChangeMetadata with model_construct, bypassing every validator.
+
+        Nothing is checked or normalized on this path, so kwargs must already
+        be valid; model_post_init still runs and fills the string cache.
+        """
+        return ChangeMetadata.model_construct(**kwargs)
+
+    @staticmethod
+    def _create_change(
+        change_type: str,
+        source_branch: str | None,
+        overrides: dict[str, Any],
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+    ) -> ChangeMetadata:
+        """Create ChangeMetadata from the _CHANGE_DEFAULTS entry for change_type.
+
+        ``strict=True`` validates in strict mode, skipping Pydantic's coercion
+        paths; only use it where the inputs already have exact types.
+        ``trusted=True`` builds through _trusted; only use it where the
+        validators themselves are not under test.
+        """
+        defaults = _CHANGE_DEFAULTS[change_type]
+        kwargs: dict[str, Any] = {
+            **defaults,
+            "change_type": change_type,
+            "source_branches": (
+                [source_branch] if source_branch else list(defaults["source_branches"])
+            ),
+        }
+        kwargs |= overrides
+        if trusted:
+            return ChangeMetadataFactory._trusted(**kwargs)
+        if strict:
+            return ChangeMetadata.model_validate(kwargs, strict=True)
+        return ChangeMetadata(**kwargs)
+
     @staticmethod
     def create_direct_change(
-        source_branch: str | None = None, **overrides: Any
+        source_branch: str | None = None,
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
     ) -> ChangeMetadata:
         """Create ChangeMetadata for a direct change (single source branch)."""
-        branch = source_branch or SharedTestConfig.DEFAULT_SOURCE_BRANCH
-        defaults: dict[str, Any] = {
-            "change_type": "direct",
-            "source_branches": [branch],
-            "target_branch": SharedTestConfig.DEFAULT_TARGET_BRANCH,
-            "merge_base": None,  # Direct changes don't have merge base
-            "pull_request_id": None,  # Direct changes typically don't have PR IDs
-        }
-        defaults.update(overrides)
-        return ChangeMetadata(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "direct", source_branch, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
     def create_merge_change(
-        source_branch: str | None = None, **overrides: Any
+        source_branch: str | None = None,
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
     ) -> ChangeMetadata:
         """Create ChangeMetadata for a merge change (feature branch merge)."""
-        branch = source_branch or "feature/new-feature"
-        defaults: dict[str, Any] = {
-            "change_type": "merge",
-            "source_branches": [branch],
-            "target_branch": "main",
-            "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
-            "pull_request_id": None,  # Let tests specify PR ID explicitly
-        }
-        defaults.update(overrides)
-        return ChangeMetadataFactory.create(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "merge", source_branch, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
     def create_squash_change(
-        source_branch: str | None = None, **overrides: Any
+        source_branch: str | None = None,
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
     ) -> ChangeMetadata:
         """Create ChangeMetadata for a squash merge (GitHub-style)."""
-        branch = source_branch or "feature/small-fix"
-        defaults: dict[str, Any] = {
-            "change_type": "squash",
-            "source_branches": [branch],
-            "target_branch": "main",
-            "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
-        }
-        defaults.update(overrides)
-        return ChangeMetadataFactory.create(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "squash", source_branch, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
     def create_octopus_change(
-        branch_count: int = 3, **overrides: Any
+        branch_count: int = 3,
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
     ) -> ChangeMetadata:
         """Create ChangeMetadata for an octopus merge (multiple source branches)."""
         if branch_count < 2:
             raise ValueError("Octopus merge requires at least 2 source branches")
 
         branches = [f"feature/branch-{i}" for i in range(branch_count)]
-        defaults: dict[str, Any] = {
-            "change_type": "octopus",
-            "source_branches": branches,
-            "target_branch": "develop",
-            "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
-            "pull_request_id": None,  # Don't include default PR ID
-        }
-        defaults.update(overrides)
-        return ChangeMetadata(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "octopus",
+            None,
+            {"source_branches": branches, **overrides},
+            strict=strict,
+            trusted=trusted,
+        )
 
     @staticmethod
     def create_rebase_change(
-        source_branch: str | None = None, **overrides: Any
+        source_branch: str | None = None,
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
     ) -> ChangeMetadata:
         """Create ChangeMetadata for a rebase operation."""
-        branch = source_branch or "feature/rebased-branch"
-        defaults: dict[str, Any] = {
-            "change_type": "rebase",
-            "source_branches": [branch] if branch else [],
-            "target_branch": "main",
-            "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
-            "pull_request_id": None,  # Rebases typically don't have PR IDs
-        }
-        defaults.update(overrides)
-        return ChangeMetadataFactory.create(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "rebase", source_branch, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
     def create_cherry_pick_change(
-        source_branch: str | None = None, **overrides: Any
+        source_branch: str | None = None,
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
     ) -> ChangeMetadata:
         """Create ChangeMetadata for a cherry-pick operation."""
-        branch = source_branch or "hotfix/cherry-picked"
-        defaults: dict[str, Any] = {
-            "change_type": "cherry-pick",
-            "source_branches": [branch] if branch else [],
-            "target_branch": "main",
-            "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
-            "pull_request_id": None,
-        }
-        defaults.update(overrides)
-        return ChangeMetadataFactory.create(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "cherry-pick", source_branch, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
     def create_revert_change(
-        source_branch: str | None = None, **overrides: Any
+        source_branch: str | None = None,
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
     ) -> ChangeMetadata:
         """Create ChangeMetadata for a revert operation."""
-        branch = source_branch or "bad-commit"
-        defaults: dict[str, Any] = {
-            "change_type": "revert",
-            "source_branches": [branch] if branch else [],
-            "target_branch": "main",
-            "merge_base": SharedTestConfig.DEFAULT_MERGE_BASE,
-            "pull_request_id": None,
-        }
-        defaults.update(overrides)
-        return ChangeMetadataFactory.create(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "revert", source_branch, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
-    def create_initial_change(**overrides: Any) -> ChangeMetadata:
+    def create_initial_change(
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
+    ) -> ChangeMetadata:
         """Create ChangeMetadata for an initial commit."""
-        defaults: dict[str, Any] = {
-            "change_type": "initial",
-            "source_branches": [],  # Initial commits have no source branches
-            "target_branch": "main",
-            "merge_base": None,  # Initial commits have no merge base
-            "pull_request_id": None,  # Initial commits have no PR
-        }
-        defaults.update(overrides)
-        return ChangeMetadata(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "initial", None, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
-    def create_amend_change(**overrides: Any) -> ChangeMetadata:
+    def create_amend_change(
+        *,
+        strict: bool = False,
+        trusted: bool = False,
+        **overrides: Any,
+    ) -> ChangeMetadata:
         """Create ChangeMetadata for an amended commit."""
-        defaults: dict[str, Any] = {
-            "change_type": "amend",
-            "source_branches": [],
-            "target_branch": "feature/fix",
-            "merge_base": None,
-            "pull_request_id": None,
-        }
-        defaults.update(overrides)
-        return ChangeMetadata(**defaults)
+        return ChangeMetadataFactory._create_change(
+            "amend", None, overrides, strict=strict, trusted=trusted
+        )
 
     @staticmethod
     def create_from_pattern(pattern_name: str, **overrides: Any) -> ChangeMetadata:
         """Create ChangeMetadata based on a pattern name."""
-        pattern_mapping: dict[str, Callable[..., ChangeMetadata]] = {
-            "direct": ChangeMetadataFactory.create_direct_change,
-            "merge": ChangeMetadataFactory.create_merge_change,
-            "squash": ChangeMetadataFactory.create_squash_change,
-            "octopus": lambda **kwargs: ChangeMetadataFactory.create_octopus_change(
-                branch_count=kwargs.pop("branch_count", 3), **kwargs
-            ),
-            "rebase": ChangeMetadataFactory.create_rebase_change,
-            "cherry-pick": ChangeMetadataFactory.create_cherry_pick_change,
-            "revert": ChangeMetadataFactory.create_revert_change,
-            "initial": ChangeMetadataFactory.create_initial_change,
-            "amend": ChangeMetadataFactory.create_amend_change,
-            "github-pr": lambda **kwargs: ChangeMetadataFactory.create_squash_change(
-                pull_request_id="123", **kwargs
-            ),
-            "hotfix": lambda **kwargs: ChangeMetadataFactory.create_direct_change(
-                source_branch="hotfix/security-patch", **kwargs
-            ),
-            "release": lambda **kwargs: ChangeMetadataFactory.create_merge_change(
-                source_branch="release/v1.0.0", **kwargs
-            ),
-        }
-
-        if pattern_name not in pattern_mapping:
+        if pattern_name not in _CHANGE_PATTERNS:
             raise ValueError(f"Unknown pattern: {pattern_name}")
 
-        factory_func = pattern_mapping[pattern_name]
-        return factory_func(**overrides)
+        # Pattern defaults hold exact types, so they validate in strict mode
+        return _CHANGE_PATTERNS[pattern_name](strict=True, **overrides)
+
+
+_CHANGE_PATTERNS: dict[str, Callable[..., ChangeMetadata]] = {
+    "direct": ChangeMetadataFactory.create_direct_change,
+    "merge": ChangeMetadataFactory.create_merge_change,
+    "squash": ChangeMetadataFactory.create_squash_change,
+    "octopus": ChangeMetadataFactory.create_octopus_change,
+    "rebase": ChangeMetadataFactory.create_rebase_change,
+    "cherry-pick": ChangeMetadataFactory.create_cherry_pick_change,
+    "revert": ChangeMetadataFactory.create_revert_change,
+    "initial": ChangeMetadataFactory.create_initial_change,
+    "amend": ChangeMetadataFactory.create_amend_change,
+    "github-pr": lambda **kwargs: ChangeMetadataFactory.create_squash_change(
+        pull_request_id="123", **kwargs
+    ),
+    "hotfix": lambda **kwargs: ChangeMetadataFactory.create_direct_change(
+        source_branch="hotfix/security-patch", **kwargs
+    ),
+    "release": lambda **kwargs: ChangeMetadataFactory.create_merge_change(
+        source_branch="release/v1.0.0", **kwargs
+    ),
+}
 
 
 class FileModificationFactory:
@@ -616,3 +708,21 @@ class DiffFactory:
         }
         defaults.update(overrides)
         return Diff(**defaults)
+
+
+class CommitFactory:
+    """Factory for creating Commit test instances."""
+
+    @staticmethod
+    def create(**overrides: Any) -> Commit:
+        """Create Commit with optional field overrides."""
+        defaults: dict[str, Any] = {
+            "metadata": GitMetadataFactory.create_regular_commit(),
+            "summary": "Add user authentication",
+            "message": "Add user authentication\n\nImplements OAuth login flow.",
+            "branches": ["main"],
+            "tags": [],
+            "diff": DiffFactory.create(),
+        }
+        defaults.update(overrides)
+        return Commit(**defaults)
@@ -0,0 +1,49 @@
+"""Tests for the msgspec bulk-ingest mirrors of the commit models."""
+
+import sys
+
+import pytest
+
+pytest.importorskip("msgspec")
+
+import msgspec
+
+from auto_release_note_generation.data_models.commit import dump_commits
+from auto_release_note_generation.data_models.fast import decode_trusted_commits
+
+from .test_factories import CommitFactory, DiffFactory, GitMetadataFactory
+
+
+class TestDecodeTrustedCommits:
+    """Test decoding of previously validated commit JSON."""
+
+    def test_round_trip_matches_validated_commits(self):
+        """Test that decoded commits equal the originals they were dumped from."""
+        commits = [
+            CommitFactory.create(),
+            CommitFactory.create(
+                metadata=GitMetadataFactory.create_merge_commit(),
+                diff=DiffFactory.create_multi_file(),
+                tags=["v1.0.0"],
+                ai_summary="Adds login",
+            ),
+            CommitFactory.create(diff=DiffFactory.create_empty()),
+        ]
+        decoded = decode_trusted_commits(dump_commits(commits))
+
+        assert decoded == commits
+        assert decoded[1].is_merge_commit()
+        assert str(decoded[0]) == str(commits[0])
+
+    def test_modification_types_are_interned(self):
+        """Test that decoded modification types are the canonical string objects."""
+        commit = CommitFactory.create(diff=DiffFactory.create_multi_file())
+        decoded = decode_trusted_commits(dump_commits([commit]))[0]
+
+        for mod in decoded.diff.modifications:
+            assert mod.modification_type is sys.intern(mod.modification_type)
+
+    def test_schema_mismatch_rejection(self):
+        """Test that payloads missing required fields are rejected."""
+        with pytest.raises(msgspec.ValidationError):
+            decode_trusted_commits(b'[{"summary": "x"}]')
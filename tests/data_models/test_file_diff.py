@@ -474,6 +474,22 @@ class TestFileModificationBehavior:
         )
         assert mod.get_all_paths() == ["file.py"]
 
+    def test_path_pair(self):
+        """Test path_pair holds (path_before, path_after), also when trusted."""
+        mod = FileModificationFactory.create_renamed_file()
+        trusted = FileModification.from_trusted(**mod.model_dump())
+
+        assert mod.path_pair == (mod.path_before, mod.path_after)
+        assert trusted.path_pair == mod.path_pair
+        assert FileModificationFactory.create_added_file().path_pair[0] is None
+
+    def test_model_copy_recomputes_path_pair(self):
+        """Test model_copy(update=...) refreshes the cached path pair."""
+        mod = FileModificationFactory.create_renamed_file()
+        moved = mod.model_copy(update={"path_after": "src/moved.py"})
+
+        assert moved.path_pair == (mod.path_before, "src/moved.py")
+
     def test_is_rename_or_copy(self):
         """Test is_rename_or_copy method."""
         rename_mod = FileModification(
@@ -635,21 +651,14 @@ class TestDiffValidation:
             )
 
     def test_invalid_affected_paths_tuple_format_rejected(self):
-        """Test that invalid tuple format in affected_paths is rejected."""
-        from auto_release_note_generation.data_models.shared import Diff
-
-        # Test with non-tuple elements
-        with pytest.raises(
-            ValueError, match="Each affected_paths entry must be a tuple"
-        ):
-            # Bypass Pydantic's initial validation to hit our custom validator
-            Diff.validate_affected_paths([("valid", "tuple"), "not_a_tuple"])  # type: ignore[list-item]
-
-        # Test with wrong tuple length
-        with pytest.raises(
-            ValueError, match="Each affected_paths entry must be a tuple"
-        ):
-            Diff.validate_affected_paths([("valid", "tuple"), ("only_one",)])  # type: ignore[list-item]
+        """Test that affected_paths tuples of the wrong length are rejected."""
+        with pytest.raises(ValidationError, match="affected_paths"):
+            Diff(
+                files_changed_count=0,
+                insertions_count=0,
+                deletions_count=0,
+                affected_paths=[("valid", "tuple"), ("only_one",)],  # type: ignore[list-item]
+            )
 
     def test_both_paths_none_rejected(self):
         """Test that tuples with both paths as None are rejected."""
@@ -722,6 +731,43 @@ class TestDiffBehavior:
         with pytest.raises(ValidationError):
             diff.files_changed_count = 2
 
+    def test_from_modifications_aggregates_metrics(self):
+        """Test that from_modifications derives counts and affected paths."""
+        mods = [
+            FileModificationFactory.create_added_file(insertions=10),
+            FileModificationFactory.create_deleted_file(deletions=4),
+            FileModificationFactory.create_renamed_file(insertions=2, deletions=1),
+        ]
+        diff = Diff.from_modifications(mods)
+
+        assert diff.modifications == mods
+        assert diff.files_changed_count == 3
+        assert diff.insertions_count == sum(m.insertions for m in mods)
+        assert diff.deletions_count == sum(m.deletions for m in mods)
+        assert diff.affected_paths == [(m.path_before, m.path_after) for m in mods]
+
+    def test_from_modifications_empty(self):
+        """Test that an empty modification list yields an empty diff."""
+        assert Diff.from_modifications([]).is_empty()
+
+    def test_model_copy_recomputes_metrics(self):
+        """Test model_copy(update=...) refreshes cached grouping and totals."""
+        empty = Diff.from_modifications([])
+        mod = FileModificationFactory.create_added_file(insertions=5)
+        updated = empty.model_copy(
+            update={
+                "modifications": [mod],
+                "files_changed_count": 1,
+                "insertions_count": 5,
+                "affected_paths": [mod.path_pair],
+            }
+        )
+
+        assert not updated.is_empty()
+        assert updated.get_total_changes() == 5
+        assert updated.get_modification_types() == {"A"}
+        assert empty.is_empty()
+
     def test_is_empty(self):
         """Test is_empty method."""
         empty_diff = Diff(
@@ -848,6 +894,24 @@ class TestDiffBehavior:
         assert len(copied) == 1
         assert copied[0].modification_type == "C"
 
+    def test_type_getters_return_independent_lists(self):
+        """Test that grouped results are copies and do not affect equality."""
+        mods = [
+            FileModificationFactory.create_renamed_file(),
+            FileModificationFactory.create_copied_file(),
+            FileModificationFactory.create_modified_file(),
+        ]
+        diff = Diff.from_modifications(mods)
+        other = Diff.from_modifications(mods)
+
+        renamed = diff.get_renamed_files()
+        renamed.clear()
+
+        assert diff.get_renamed_files() == [mods[0]]
+        assert diff.get_copied_files() == [mods[1]]
+        assert diff.get_modification_types() == {"R", "C", "M"}
+        assert diff == other
+
     def test_get_all_affected_paths(self):
         """Test get_all_affected_paths method."""
         mod1 = FileModification(
@@ -884,6 +948,16 @@ class TestDiffBehavior:
         assert set(paths) == {"added.py", "deleted.py", "old.py", "new.py"}
         assert paths == sorted(paths)  # Should be sorted
 
+    def test_get_all_affected_paths_keeps_empty_strings(self):
+        """Test that only None entries are skipped, not empty-string paths."""
+        diff = Diff(
+            files_changed_count=0,
+            insertions_count=0,
+            deletions_count=0,
+            affected_paths=[("", "x"), (None, "x")],
+        )
+        assert diff.get_all_affected_paths() == ["", "x"]
+
     def test_string_representation(self):
         """Test string representations."""
         # Empty diff
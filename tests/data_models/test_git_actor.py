@@ -8,7 +8,6 @@ from pydantic import ValidationError
 
 from auto_release_note_generation.data_models.shared import GitActor
 
-from .conftest import SharedTestConfig
 from .strategies import (
     invalid_actor_data,
     valid_git_actor,
@@ -16,7 +15,7 @@ from .strategies import (
     valid_git_actor_name,
     valid_git_timestamp,
 )
-from .test_data import GitTestData
+from .test_data import GitTestData, SharedTestConfig
 from .test_factories import GitActorFactory
 
 
@@ -36,12 +35,6 @@ class TestGitActorValidation:
         assert actor.email == email.lower()
         assert actor.timestamp == timestamp
 
-    @given(invalid_actor_data())
-    def test_invalid_name_rejection(self, invalid_data):
-        """Test that invalid names raise ValidationError."""
-        with pytest.raises(ValidationError):
-            GitActor(**invalid_data)
-
     @given(invalid_actor_data())
     def test_invalid_actor_data_rejection(self, invalid_data):
         """Test that invalid actor data raises ValidationError."""
@@ -99,6 +92,14 @@ class TestGitActorBehavior:
         expected = "John Doe <john.doe@example.com> 1672574400 +0000"
         assert str(actor) == expected
 
+    def test_string_representation_does_not_affect_equality(self):
+        """Test that rendering one actor keeps it equal to an unrendered twin."""
+        actor = GitActorFactory.create()
+        twin = GitActorFactory.create()
+
+        assert str(actor) == str(twin)
+        assert actor == twin
+
     def test_string_representation_without_timezone(self):
         """Test __str__ handles naive datetime."""
         naive_time = datetime(2023, 1, 1, 12, 0, 0)
@@ -118,6 +119,20 @@ class TestGitActorBehavior:
         assert f"email='{actor.email}'" in repr_str
         assert f"timestamp={actor.timestamp.isoformat()}" in repr_str
 
+    def test_from_trusted_skips_validation(self, default_git_actor):
+        """Test from_trusted rebuilds an equal actor from validated data."""
+        trusted = GitActor.from_trusted(**dict(default_git_actor))
+
+        assert trusted == default_git_actor
+        assert str(trusted) == str(default_git_actor)
+
+    def test_model_copy_recomputes_string(self, default_git_actor):
+        """Test model_copy(update=...) refreshes the cached Git-format string."""
+        renamed = default_git_actor.model_copy(update={"name": "Renamed Author"})
+
+        assert str(renamed).startswith("Renamed Author <")
+        assert str(default_git_actor).startswith(f"{default_git_actor.name} <")
+
     def test_string_methods_consistency(self, git_actors_collection):
         """Test that str and repr work consistently across instances."""
         for actor in git_actors_collection:
@@ -117,6 +117,24 @@ class TestGitMetadataBehavior:
         assert metadata.is_merge_commit() == expected_merge
         assert metadata.is_root_commit() == expected_root
 
+        # Cached flags are also populated on the trusted (unvalidated) path
+        trusted = GitMetadata.from_trusted(**dict(metadata))
+        assert trusted.is_merge_commit() == expected_merge
+        assert trusted.is_root_commit() == expected_root
+
+    def test_model_copy_recomputes_derived_values(self):
+        """Test model_copy(update=...) refreshes cached flags and short SHA."""
+        root = GitMetadataFactory.create_root_commit(sha="abc12345def67890")
+        merge = root.model_copy(
+            update={"sha": "fedcba9876543210", "parents": ["a" * 40, "b" * 40]}
+        )
+
+        assert merge.is_merge_commit() is True
+        assert merge.is_root_commit() is False
+        assert merge.short_sha == "fedcba98"
+        assert str(merge) == "fedcba98 (2 parents)"
+        assert root.is_root_commit() is True
+
     def test_string_representation_format(self):
         """Test __str__ returns compact format."""
         # Root commit
@@ -142,6 +160,13 @@ class TestGitMetadataBehavior:
         assert "[signed]" in result
         assert "abc12345" in result
 
+    def test_from_trusted_skips_validation(self, default_git_metadata):
+        """Test from_trusted rebuilds equal metadata from validated data."""
+        trusted = GitMetadata.from_trusted(**dict(default_git_metadata))
+
+        assert trusted == default_git_metadata
+        assert trusted.author is default_git_metadata.author
+
     def test_repr_format(self, default_git_metadata):
         """Test __repr__ returns detailed representation."""
         repr_str = repr(default_git_metadata)
@@ -265,6 +290,12 @@ class TestGitMetadataFactory:
 
         assert metadata.sha == custom_sha
 
+    def test_commit_type_examples_round_trip(self, commit_type_examples):
+        """Test each commit type example survives a dump/validate round trip."""
+        _name, metadata = commit_type_examples
+
+        assert GitMetadata.model_validate(metadata.model_dump()) == metadata
+
     def test_specialized_factory_methods(self):
         """Test specialized factory methods."""
         # Root commit
@@ -287,13 +318,13 @@ class TestGitMetadataFactory:
         signed = GitMetadataFactory.create_signed_commit()
         assert signed.gpg_signature is not None
 
-    def test_pattern_based_creation(self):
+    @pytest.mark.parametrize(
+        "pattern", ["root", "regular", "merge", "octopus", "signed"]
+    )
+    def test_pattern_based_creation(self, pattern):
         """Test pattern-based factory creation."""
-        patterns = ["root", "regular", "merge", "octopus", "signed"]
-
-        for pattern in patterns:
-            metadata = GitMetadataFactory.create_from_pattern(pattern)
-            assert isinstance(metadata, GitMetadata)
+        metadata = GitMetadataFactory.create_from_pattern(pattern)
+        assert isinstance(metadata, GitMetadata)
 
     @given(valid_git_sha())
     def test_factory_with_hypothesis(self, sha):
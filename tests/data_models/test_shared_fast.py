@@ -0,0 +1,263 @@
+"""Tests for the slotted dataclass mirrors of the shared models."""
+
+from typing import Any
+
+import pytest
+from pydantic import ValidationError
+
+from auto_release_note_generation.data_models.shared import (
+    Diff,
+    FileModification,
+    GitActor,
+    GitMetadata,
+)
+from auto_release_note_generation.data_models.shared_fast import (
+    DiffColumns,
+    DiffRecord,
+    FileModificationRecord,
+    GitActorRecord,
+    GitMetadataRecord,
+)
+
+from .test_data import SharedTestConfig
+from .test_factories import DiffFactory, FileModificationFactory
+
+
+class TestRecordEquivalence:
+    """Test that valid records convert to the same models Pydantic builds."""
+
+    def test_git_actor_record_normalization(self):
+        """Test that name/email are stripped and the email is lowercased."""
+        data: dict[str, Any] = {
+            "name": "  Jane Doe  ",
+            "email": " Jane.Doe@Example.COM ",
+            "timestamp": SharedTestConfig.DEFAULT_TIMESTAMP,
+        }
+        record = GitActorRecord(**data)
+
+        assert record.to_pydantic() == GitActor(**data)
+        assert str(record.to_pydantic()) == str(GitActor(**data))
+
+    def test_git_metadata_record_normalization(self):
+        """Test that SHAs, parents and signatures are normalized like GitMetadata."""
+        actor: dict[str, Any] = {
+            "name": SharedTestConfig.DEFAULT_NAME,
+            "email": SharedTestConfig.DEFAULT_EMAIL,
+            "timestamp": SharedTestConfig.DEFAULT_TIMESTAMP,
+        }
+        data: dict[str, Any] = {
+            "sha": f"  {SharedTestConfig.DEFAULT_SHA.upper()}  ",
+            "parents": [SharedTestConfig.DEFAULT_PARENT_SHA.upper()],
+            "gpg_signature": "   ",
+        }
+        record = GitMetadataRecord(
+            author=GitActorRecord(**actor), committer=GitActorRecord(**actor), **data
+        )
+        expected = GitMetadata(
+            author=GitActor(**actor), committer=GitActor(**actor), **data
+        )
+
+        converted = record.to_pydantic()
+        assert converted == expected
+        assert converted.short_sha == expected.short_sha
+        assert converted.is_root_commit() is False
+
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"modification_type": "A", "path_after": " src\\new.py "},
+            {"modification_type": "D", "path_before": "old.py"},
+            {"modification_type": "M", "path_before": "a.py", "path_after": "a.py"},
+            {"modification_type": "R", "path_before": "a.py", "path_after": "b.py"},
+            {"modification_type": "T", "path_before": "   ", "path_after": "link"},
+        ],
+    )
+    def test_file_modification_record_normalization(self, data):
+        """Test that paths are normalized the same way as FileModification."""
+        full = {"insertions": 3, "deletions": 1, "patch": " @@ -1 +1 @@ ", **data}
+
+        assert FileModificationRecord(**full).to_pydantic() == FileModification(**full)
+
+    def test_diff_record_conversion(self):
+        """Test that a diff record converts nested modifications."""
+        mod: dict[str, Any] = {
+            "modification_type": "M",
+            "path_before": "a.py",
+            "path_after": "a.py",
+        }
+        counts = {"files_changed_count": 1, "insertions_count": 2, "deletions_count": 0}
+        record = DiffRecord(
+            modifications=[FileModificationRecord(insertions=2, deletions=0, **mod)],
+            affected_paths=[("a.py", "a.py")],
+            **counts,
+        )
+        expected = Diff(
+            modifications=[FileModification(insertions=2, deletions=0, **mod)],
+            affected_paths=[("a.py", "a.py")],
+            **counts,
+        )
+
+        assert record.to_pydantic() == expected
+
+
+class TestRecordValidation:
+    """Test that records reject the same input the Pydantic models reject."""
+
+    @pytest.mark.parametrize(
+        ("record_cls", "model_cls", "data", "match"),
+        [
+            (GitActorRecord, GitActor, {"name": "   ", "email": "a@b.c"}, "name"),
+            (GitActorRecord, GitActor, {"name": "A", "email": "x" * 321}, "email"),
+            (
+                FileModificationRecord,
+                FileModification,
+                {"modification_type": "Z", "path_after": "a.py"},
+                "modification_type must be one of",
+            ),
+            (
+                FileModificationRecord,
+                FileModification,
+                {"modification_type": "A", "path_before": "a.py", "path_after": "b"},
+                "cannot have path_before",
+            ),
+            (
+                FileModificationRecord,
+                FileModification,
+                {"modification_type": "R", "path_before": "a.py", "path_after": "a.py"},
+                "must have different",
+            ),
+            (
+                FileModificationRecord,
+                FileModification,
+                {"modification_type": "A", "path_after": "a\x00b"},
+                "null bytes",
+            ),
+            (
+                FileModificationRecord,
+                FileModification,
+                {"modification_type": "A", "path_after": "a.py", "insertions": -1},
+                "greater than or equal to 0",
+            ),
+            (DiffRecord, Diff, {"files_changed_count": 1}, "Must have modifications"),
+            (DiffRecord, Diff, {"affected_paths": [(None, None)]}, "At least one path"),
+            (
+                DiffRecord,
+                Diff,
+                {"affected_paths": [("a.py", "a.py"), "not_a_tuple"]},
+                "Each affected_paths entry must be a tuple",
+            ),
+            (
+                DiffRecord,
+                Diff,
+                {"affected_paths": [("a.py", "a.py"), ("only_one",)]},
+                "Each affected_paths entry must be a tuple",
+            ),
+        ],
+    )
+    def test_invalid_input_rejection(self, record_cls, model_cls, data, match):
+        """Test that invalid data raises ValueError where Pydantic raises."""
+        defaults: dict[type, dict[str, Any]] = {
+            GitActorRecord: {"timestamp": SharedTestConfig.DEFAULT_TIMESTAMP},
+            FileModificationRecord: {"insertions": 0, "deletions": 0},
+            DiffRecord: {
+                "files_changed_count": 0,
+                "insertions_count": 0,
+                "deletions_count": 0,
+            },
+        }
+        full = {**defaults[record_cls], **data}
+
+        with pytest.raises(ValidationError):
+            model_cls(**full)
+        with pytest.raises(ValueError, match=match):
+            record_cls(**full)
+
+    @pytest.mark.parametrize("sha", ["abc", "xyz12345", "a" * 65])
+    def test_invalid_sha_rejection(self, sha):
+        """Test that invalid commit SHAs are rejected."""
+        actor = GitActorRecord(
+            name="A", email="a@b.c", timestamp=SharedTestConfig.DEFAULT_TIMESTAMP
+        )
+
+        with pytest.raises(ValueError, match="SHA must"):
+            GitMetadataRecord(sha=sha, author=actor, committer=actor)
+
+    def test_string_timestamp_rejection(self):
+        """Test that timestamps are not coerced from strings."""
+        with pytest.raises(ValueError, match="timestamp must be a datetime"):
+            GitActorRecord(name="A", email="a@b.c", timestamp="2023-01-01")  # type: ignore[arg-type]
+
+    def test_records_are_frozen_and_slotted(self):
+        """Test that records are immutable and have no instance __dict__."""
+        record = GitActorRecord(
+            name="A", email="a@b.c", timestamp=SharedTestConfig.DEFAULT_TIMESTAMP
+        )
+
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.name = "B"  # type: ignore[misc]
+
+
+class TestDiffColumns:
+    """Test the struct-of-arrays view of a Diff."""
+
+    def test_round_trip_matches_diff(self):
+        """Test that converting to columns and back preserves the Diff."""
+        diff = Diff.from_modifications(
+            [
+                FileModificationFactory.create_added_file(patch="@@ +1 @@"),
+                FileModificationFactory.create_deleted_file(),
+                FileModificationFactory.create_modified_file(),
+                FileModificationFactory.create_renamed_file(),
+                FileModificationFactory.create_copied_file(),
+            ]
+        )
+        columns = DiffColumns.from_modifications(diff.modifications)
+
+        assert len(columns) == len(diff.modifications)
+        assert columns.to_diff() == diff
+
+    def test_aggregates_match_diff(self):
+        """Test that column aggregates agree with the Diff methods."""
+        diff = DiffFactory.create_multi_file(file_count=5)
+        columns = DiffColumns.from_modifications(diff.modifications)
+
+        assert columns.get_total_changes() == sum(
+            m.insertions + m.deletions for m in diff.modifications
+        )
+        assert columns.get_modification_types() == diff.get_modification_types()
+
+    def test_renamed_and_copied_paths(self):
+        """Test that rename/copy rows are selected by type code."""
+        renamed = FileModificationFactory.create_renamed_file()
+        copied = FileModificationFactory.create_copied_file()
+        columns = DiffColumns.from_modifications(
+            [FileModificationFactory.create_modified_file(), renamed, copied]
+        )
+
+        assert columns.get_renamed_paths() == [
+            (renamed.path_before, renamed.path_after)
+        ]
+        assert columns.get_copied_paths() == [(copied.path_before, copied.path_after)]
+
+    def test_accepts_records_and_interns_paths(self):
+        """Test that records are accepted and equal paths share one object."""
+        record = FileModificationRecord(
+            modification_type="M",
+            insertions=1,
+            deletions=1,
+            path_before="".join(["src/", "a.py"]),
+            path_after="".join(["src/", "a.py"]),
+        )
+        columns = DiffColumns.from_modifications([record])
+
+        assert columns.paths_before[0] is columns.paths_after[0]
+        assert columns.to_diff().modifications == [record.to_pydantic()]
+
+    def test_empty_columns(self):
+        """Test that no modifications give an empty diff."""
+        columns = DiffColumns.from_modifications([])
+
+        assert len(columns) == 0
+        assert columns.get_modification_types() == set()
+        assert columns.to_diff().is_empty()
@@ -45,6 +45,14 @@ class TestValidateAndNormalizeSha:
         long_sha = "a" * 64
         assert validate_and_normalize_sha(long_sha) == long_sha
 
+    def test_normalized_sha_returned_unchanged(self):
+        """Test that already-normalized SHAs are returned without copying."""
+        full_sha = "".join(["abc123def456789abcdef", "123456789abcdef1234"])
+        assert validate_and_normalize_sha(full_sha) is full_sha
+
+        # Trailing newlines are not treated as already normalized
+        assert validate_and_normalize_sha("abc123\n") == "abc123"
+
     def test_valid_hex_characters(self):
         """Test that valid hexadecimal characters are accepted."""
         # All lowercase hex digits